@@ -24,33 +24,37 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 from datetime import date, timedelta
-from math import pi, sin
 
+from biorhythm_cycles import (calculate, get_legend, get_periods, get_symbols,
+                              mark, today)
 
-def get_bio(birth=date.today(), plot=date.today(), width=45, days=14):
+
+def get_bio(birth=None, plot=None, width=45, days=14):
     """ Plots a chart of physical, emotional, and intellectual cycles.
     PARAMETERS:
     birth : birth date of the person
     plot  : plot date of the chart
     width : width of the chart in characters
     days  : number of days to show before and after the plot date
+    NOTES:
+    The cycles are the active set of the shared cycle registry.
     """
+    birth = today() if birth is None else birth
+    plot = today() if plot is None else plot
+    waves, symbols = get_periods(), get_symbols()  # active set
     width = max(15, width)
     midwidth = width // 2
     print('BIORHYTHM for Birth Date:', f'{birth:%A, %d %B %Y}')
-    print('p=physical, e=emotional, i=intellectual for days since birth')
+    print(get_legend(), 'for days since birth')
     print('Date', ' ' * 10, '-100%', '=' * (width - 12), '+100%', 'Day')
     dates = (plot + timedelta(days=d) for d in range(-days, days + 1))
     for d in dates:
         n = (d - birth).days
-        p = midwidth + int(sin(2 * pi * n / 23) * (midwidth - 1))
-        e = midwidth + int(sin(2 * pi * n / 28) * (midwidth - 1))
-        i = midwidth + int(sin(2 * pi * n / 33) * (midwidth - 1))
+        indices = [midwidth + int(v * (midwidth - 1))
+                   for v in calculate(n, waves)]
         out = ['-' if d == plot else ' '] * width
         out[midwidth] = ':'
-        out[p] = '*' if p in {e, i} else 'p'
-        out[e] = '*' if e in {i, p} else 'e'
-        out[i] = '*' if i in {p, e} else 'i'
+        mark(out, indices, symbols)  # '*' for overlapping values
         print(f'{d:%a %d %b %Y}', ''.join(out), f'{n:,}')
 
 
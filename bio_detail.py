@@ -47,30 +47,34 @@ https://braintumor.org/
 https://www.cancer.org/
 """
 from datetime import date, timedelta
-from math import pi, sin
 
+from biorhythm_cycles import (calculate, get_legend, get_periods, get_symbols,
+                              mark, today)
 
-def get_data(birth=date.today(), plot=date.today(), days=7):
+
+def get_data(birth=None, plot=None, days=7):
     """ Gets the calculated physical, emotional, and intellectual data.
     PARAMETERS:
     birth : birth date of the person
     plot  : plot date of the data
     days  : number of days to include before and after the plot date
     RETURNS:
-    The physical, emotional, and intellectual data
+    The physical, emotional, and intellectual data, one tuple per date of the
+    date, the number of days since birth, and one value for each cycle of
+    the active set of the shared cycle registry
     """
+    birth = today() if birth is None else birth
+    plot = today() if plot is None else plot
+    waves = get_periods()  # active set
     data = []
     dates = (plot + timedelta(days=d) for d in range(-days, days + 1))
     for d in dates:
         n = (d - birth).days  # number of days since birth
-        p = sin(2 * pi * n / 23)  # physical
-        e = sin(2 * pi * n / 28)  # emotional
-        i = sin(2 * pi * n / 33)  # intellectual
-        data.append((d, n, p, e, i))  # extra parentheses, appends tuple
+        data.append((d, n, *calculate(n, waves)))  # appends tuple
     return data
 
 
-def plot_chart(birth=date.today(), plot=date.today(), width=25, days=7):
+def plot_chart(birth=None, plot=None, width=25, days=7):
     """ Plots a chart of physical, emotional, and intellectual cycles.
     PARAMETERS:
     birth : birth date of the person
@@ -80,28 +84,27 @@ def plot_chart(birth=date.today(), plot=date.today(), width=25, days=7):
     REMARKS:
     The default output is optimized for a traditional 80x24 console window.
     The chart width and days range can be set to fit your system.
+    The cycles are the active set of the shared cycle registry.
     """
+    birth = today() if birth is None else birth
+    plot = today() if plot is None else plot
     width = max(15, width)
     midwidth = width // 2
+    symbols = get_symbols()  # active set
     print('BIORHYTHM for Birth Date:', f'{birth:%A, %d %B %Y}')
-    print('p=physical, e=emotional, i=intellectual for days since birth')
+    print(get_legend(), 'for days since birth')
     print(' ', 'Date', ' ' * 10, '-100%', '=' * (width - 12), '+100%',
-          '   p   ', '   e   ', '   i   ', 'Day')
+          *(f'{symbol:^7}' for symbol in symbols), 'Day')
     data = get_data(birth=birth, plot=plot, days=days)
-    for d, n, p, e, i in data:
-        _p = midwidth + int(p * (midwidth - 1))  # starting from middle zero,
-        _e = midwidth + int(e * (midwidth - 1))  # adds -/+ percentages of
-        _i = midwidth + int(i * (midwidth - 1))  # width toward -100% or +100%
+    for d, n, *values in data:
+        indices = [midwidth + int(v * (midwidth - 1))  # from middle zero, adds
+                   for v in values]  # -/+ percentages of width toward edges
         out = ['-' if d == plot else ' '] * width
         out[midwidth] = ':'
-        out[_p] = '*' if _p in {_e, _i} else 'p'  # '*' for overlapping values
-        out[_e] = '*' if _e in {_i, _p} else 'e'
-        out[_i] = '*' if _i in {_p, _e} else 'i'
+        mark(out, indices, symbols)  # '*' for overlapping values
         print('>' if d == plot else ' ',
               f'{d:%a %d %b %Y}', ''.join(out),
-              f'{f"{p:+.1%}":>7}',  # nested percentage and alignment formats
-              f'{f"{e:+.1%}":>7}',
-              f'{f"{i:+.1%}":>7}',
+              *(f'{f"{v:+.1%}":>7}' for v in values),  # nested formats
               f'{n:,}')
 
 
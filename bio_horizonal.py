@@ -24,11 +24,17 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+from collections import deque
 from datetime import date, timedelta
-from math import pi, sin
+import sys
 
+from biorhythm_cycles import (calculate, get_legend, get_periods, get_symbols,
+                              today)
 
-def get_bio(birth=date.today(), plot=date.today(), rows=21, days=7):
+blanks = {'   ', ' : ', ' - '}  # symbols of a cell without any cycle
+
+
+def get_bio(birth=None, plot=None, rows=21, days=7):
     """ Plots a chart of physical, emotional, and intellectual cycles.
     PARAMETERS:
     birth : birth date of the person
@@ -36,47 +42,177 @@ def get_bio(birth=date.today(), plot=date.today(), rows=21, days=7):
     rows  : number of rows to show for the chart height
     days  : number of days to show before and after the plot date
     """
+    sys.stdout.write(get_chart(birth=birth, plot=plot, rows=rows, days=days))
+
+
+def get_chart(birth=None, plot=None, rows=21, days=7):
+    """ Renders a chart of physical, emotional, and intellectual cycles.
+    PARAMETERS:
+    birth : birth date of the person
+    plot  : plot date of the chart
+    rows  : number of rows to show for the chart height
+    days  : number of days to show before and after the plot date
+    RETURNS:
+    The chart text, exactly as printed by get_bio
+    NOTES:
+    The grid of symbols is preallocated with the blank and center rows, then
+    only the plot date column and one cell per cycle and day are filled in,
+    so the cost grows with rows plus days instead of rows times days.  The
+    cycles are the active set of the shared cycle registry.
+    """
+    birth = today() if birth is None else birth
+    plot = today() if plot is None else plot
     rows = (rows + 1) if (rows % 2) == 0 else rows  # force odd rows
     midrow = rows // 2
-    print('BIORHYTHM for Birth Date:', f'{birth:%A, %d %B %Y}')
-    print('               Plot Date:', f'{plot:%A, %d %B %Y}')
-    print('p=physical, e=emotional, i=intellectual for days since birth')
-    data = []
-    dates = (plot + timedelta(days=d) for d in range(-days, days + 1))
-    for d in dates:
-        n = (d - birth).days  # number of days since birth
-        p = sin(2 * pi * n / 23)  # physical
-        e = sin(2 * pi * n / 28)  # emotional
-        i = sin(2 * pi * n / 33)  # intellectual
-        data.append((d.day, p, e, i))  # extra parentheses, appends tuple
+    dates = [plot + timedelta(days=d) for d in range(-days, days + 1)]
+    waves, symbols = get_periods(), get_symbols()  # active set, per chart
+    grid = [[' - ' if row == midrow else '   '] * len(dates)
+            for row in range(rows)]  # symbols use 3 chars
+    for row in grid:  # plot date is the middle column
+        row[days] = ' : '
+    for column, d in enumerate(dates):
+        indices = get_indices(birth, d, rows, waves)
+        for symbol, row in zip(symbols, indices):
+            cell = grid[row][column]
+            grid[row][column] = f' {symbol} ' if cell in blanks else ' * '
+    lines = [f'BIORHYTHM for Birth Date: {birth:%A, %d %B %Y}',
+             f'               Plot Date: {plot:%A, %d %B %Y}',
+             get_legend() + ' for days since birth']
     for row in range(rows):
-        label = '     '  # labels use 5 chars
-        if row == 0:
-            label = '+100%'
-        elif row == midrow:
-            label = '    0'
-        elif row == (rows - 1):
-            label = '-100%'
-        out = ''
-        for day, p, e, i in data:
-            symbol = '   '  # symbols use 3 chars
-            if (midrow - int(p * midrow)) == row:
-                symbol = ' p ' if symbol == '   ' else ' * '
-            if (midrow - int(e * midrow)) == row:
-                symbol = ' e ' if symbol == '   ' else ' * '
-            if (midrow - int(i * midrow)) == row:
-                symbol = ' i ' if symbol == '   ' else ' * '
-            if day == plot.day:
-                symbol = ' : ' if symbol == '   ' else symbol
-            if midrow == row:
-                symbol = ' - ' if symbol == '   ' else symbol
-            out += symbol
-        print(label, out, sep=' |')
-    print('     ', '---' * (days * 2 + 1), sep=' +')
-    out = ''
-    for day, *_ in data:
-        out += f'{day:^3}'
-    print('  Day', out, sep='  ')
+        lines.append(get_label(row, rows) + ' |' + ''.join(grid[row]))
+    lines.append('      +' + '---' * len(dates))
+    lines.append('  Day  ' + ''.join(f'{d.day:^3}' for d in dates))
+    lines.append('')  # trailing newline
+    return '\n'.join(lines)
+
+
+def get_label(row, rows):
+    """ Gets the label of a chart row.
+    PARAMETERS:
+    row  : index of the row, from the top
+    rows : number of rows of the chart height (odd)
+    RETURNS:
+    The label, 5 chars
+    """
+    if row == 0:
+        return '+100%'
+    if row == rows // 2:
+        return '    0'
+    if row == (rows - 1):
+        return '-100%'
+    return '     '
+
+
+def get_indices(birth, d, rows, waves):
+    """ Gets the chart rows of the physical, emotional, and intellectual data.
+    PARAMETERS:
+    birth : birth date of the person
+    d     : date of the column
+    rows  : number of rows of the chart height (odd)
+    waves : wavelengths of the cycles
+    RETURNS:
+    The index of the row of each cycle, from the top
+    """
+    midrow = rows // 2
+    n = (d - birth).days  # number of days since birth
+    return [midrow - int(v * midrow) for v in calculate(n, waves)]
+
+
+def get_column(birth, d, plot, rows, waves, symbols):
+    """ Gets the symbols of one chart column.
+    PARAMETERS:
+    birth   : birth date of the person
+    d       : date of the column
+    plot    : plot date of the chart, its column is highlighted
+    rows    : number of rows of the chart height (odd)
+    waves   : wavelengths of the cycles
+    symbols : symbols of the cycles
+    RETURNS:
+    The symbols of the column from the top row down, 3 chars each
+    """
+    column = [' : ' if d == plot else '   '] * rows
+    column[rows // 2] = ' : ' if d == plot else ' - '
+    for symbol, row in zip(symbols, get_indices(birth, d, rows, waves)):
+        column[row] = f' {symbol} ' if column[row] in blanks else ' * '
+    return column
+
+
+class Window:
+    """ A horizontal chart that slides along the dates one day at a time.
+    ATTRIBUTES:
+    birth : birth date of the person
+    plot  : plot date of the chart, its column is highlighted
+    rows  : number of rows to show for the chart height (odd)
+    days  : number of days to show before and after the plot date
+    NOTES:
+    The chart columns are kept in a ring buffer, so advancing the chart only
+    computes the columns entering the chart and the two highlighted columns,
+    instead of shifting every row of the chart.
+    """
+
+    def __init__(self, birth=None, plot=None, rows=21, days=7):
+        """ Initializes a chart window.
+        PARAMETERS:
+        birth : birth date of the person
+        plot  : plot date of the chart
+        rows  : number of rows to show for the chart height
+        days  : number of days to show before and after the plot date
+        """
+        birth = today() if birth is None else birth
+        plot = today() if plot is None else plot
+        self.birth = birth
+        self.plot = plot
+        self.rows = (rows + 1) if (rows % 2) == 0 else rows  # force odd rows
+        self.days = days
+        self.__waves = get_periods()  # active set, looked up once
+        self.__symbols = get_symbols()
+        self.__legend = get_legend()
+        self.__columns = deque(maxlen=days * 2 + 1)  # oldest columns drop off
+        for d in range(-days, days + 1):
+            self.__columns.append(self.__get(plot + timedelta(days=d)))
+
+    def __get(self, d):
+        """ Gets the day of the month and the symbols of a column. """
+        return d.day, get_column(self.birth, d, self.plot, self.rows,
+                                 self.__waves, self.__symbols)
+
+    def advance(self, days=1):
+        """ Moves the chart along the dates.
+        PARAMETERS:
+        days : number of days to move, negative moves back
+        """
+        old, self.plot = self.plot, self.plot + timedelta(days=days)
+        if abs(days) >= len(self.__columns):  # no columns left to keep
+            days = len(self.__columns)
+            old = self.plot - timedelta(days=days)
+        for d in range(1, abs(days) + 1):
+            if days > 0:  # entering at the end, leaving at the start
+                self.__columns.append(self.__get(
+                    old + timedelta(days=self.days + d)))
+            else:  # entering at the start, leaving at the end
+                self.__columns.appendleft(self.__get(
+                    old - timedelta(days=self.days + d)))
+        index = self.days - days  # position of the old plot date
+        if 0 <= index < len(self.__columns):
+            self.__columns[index] = self.__get(old)
+        self.__columns[self.days] = self.__get(self.plot)
+
+    def render(self):
+        """ Returns the chart text, exactly as printed by get_bio. """
+        lines = [f'BIORHYTHM for Birth Date: {self.birth:%A, %d %B %Y}',
+                 f'               Plot Date: {self.plot:%A, %d %B %Y}',
+                 self.__legend + ' for days since birth']
+        for row in range(self.rows):
+            lines.append(get_label(row, self.rows) + ' |' +
+                         ''.join(column[row] for _, column in self.__columns))
+        lines.append('      +' + '---' * len(self.__columns))
+        lines.append('  Day  ' + ''.join(f'{day:^3}'
+                                         for day, _ in self.__columns))
+        return '\n'.join(lines) + '\n'
+
+    def print(self):
+        """ Prints the chart. """
+        print(self.render(), end='')
 
 
 if __name__ == '__main__':
@@ -57,17 +57,28 @@ https://www.cancer.org/
 from datetime import datetime, timedelta
 import math
 
+from biorhythm_cycles import (calculate, get_cycles, get_ordinal, mark, now,
+                              to_zone)
 
-def get_bio(birthdate=datetime.now(),
-            plotdate=datetime.now(),
-            width=55, days=29):
+
+def get_bio(birthdate=None,
+            plotdate=None,
+            width=55, days=29, tz=None):
     """ Gets a biorhythm chart.
     PARAMETERS:
     birthdate : the birth date of the person
     plotdate  : the plot date of the chart
     width     : the width of the chart
     days      : the number of days to plot
+    tz        : the time zone in which to count the days, aware dates are
+                converted to it first, default is each date's own
+    NOTES:
+    The cycles are the active set of the shared cycle registry.
     """
+    birthdate = now() if birthdate is None else birthdate
+    plotdate = now() if plotdate is None else plotdate
+    birthdate = to_zone(birthdate, tz=tz)  # only aware dates are converted
+    plotdate = to_zone(plotdate, tz=tz)
 
     # Define the output date and number formats
     longdate = '%a %b %d %Y'  # Wed Jan 31 1900
@@ -75,11 +86,12 @@ def get_bio(birthdate=datetime.now(),
     percent = '{:+.1f}%'      # +999.9%
     number = '{:,}'           # 9,999
 
-    # Define the wavelengths (days per cycle)
+    # Define the wavelengths (days per cycle) and symbols from the active set
+    # of the shared cycle registry
     # https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
-    pwave = 23  # physical
-    ewave = 28  # emotional
-    iwave = 33  # intellectual
+    cycles = get_cycles(enabled=True)
+    waves = [cycle.period for cycle in cycles]
+    symbols = [cycle.symbol for cycle in cycles]
 
     # Sanity check (minimum width of the chart title)
     if width < 12:
@@ -90,15 +102,17 @@ def get_bio(birthdate=datetime.now(),
     middays = math.floor(days / 2)
 
     # Count the number of days since birth
-    count = (plotdate - birthdate).days
+    # Calendar days are counted by their day numbers (ordinals), so the
+    # times of the day never make the count off by one
+    birthday = get_ordinal(birthdate)
+    count = get_ordinal(plotdate) - birthday
 
     # Write the chart header and label keys
     print('Birth:  ', birthdate.strftime(longdate), sep='')
     print('Plot:   ', plotdate.strftime(longdate), sep='')
     print('Alive:  ', number.format(count), ' days', sep='')
-    print('p:      Physical')
-    print('e:      Emotional')
-    print('i:      Intellectual')
+    for cycle in cycles:
+        print(f'{cycle.symbol}:'.ljust(8), cycle.name.title(), sep='')
 
     # Write the chart title
     # The length of '-100% ' and ' +100%' equals 12 characters total
@@ -113,14 +127,14 @@ def get_bio(birthdate=datetime.now(),
     lowdate = plotdate - timedelta(days=middays)
 
     # Loop through each of the days
-    ppercent = epercent = ipercent = ''
+    percents = [''] * len(cycles)
     for n in range(days):
 
         # Calculate the next day to plot
         nextdate = lowdate + timedelta(days=n)
 
         # Count the number of days since birth
-        count = (nextdate - birthdate).days
+        count = nextdate.toordinal() - birthday
 
         # Calculate the point values
         # https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)#Calculation
@@ -129,52 +143,44 @@ def get_bio(birthdate=datetime.now(),
         # number of radians in a circle; the official calculation specifies to
         # then multiply by the number of days since birth and divide by the
         # wavelength; the resulting amplitude will be a decimal value which
-        # occurs somewhere between -1 and +1
-        pvalue = math.sin((2 * math.pi * count) / pwave)
-        evalue = math.sin((2 * math.pi * count) / ewave)
-        ivalue = math.sin((2 * math.pi * count) / iwave)
+        # occurs somewhere between -1 and +1; the values are looked up from
+        # the precomputed sine values shared by all of the chart modules
+        values = calculate(count, waves)
 
         # Calculate the point locations
         # The point values must be multiplied by half of the chart width to
         # calculate the final -/+ distance from the center line
-        pindex = math.floor(pvalue * (midwidth - 1)) + midwidth
-        eindex = math.floor(evalue * (midwidth - 1)) + midwidth
-        iindex = math.floor(ivalue * (midwidth - 1)) + midwidth
+        indices = [math.floor(value * (midwidth - 1)) + midwidth
+                   for value in values]
 
         # Write the plot line, use an array of spaces equal to the chart width
+        # Overlapping points are written as '*'
         space = ' '
         if nextdate == plotdate:
             space = '-'
-            ppercent = percent.format(pvalue * 100)
-            epercent = percent.format(evalue * 100)
-            ipercent = percent.format(ivalue * 100)
+            percents = [percent.format(value * 100) for value in values]
         out = list(space * width)
         out[midwidth] = ':'
-        out[pindex] = 'p'
-        out[eindex] = 'e'
-        out[iindex] = 'i'
-        if pindex == eindex:
-            out[pindex] = '*'
-        if eindex == iindex:
-            out[eindex] = '*'
-        if iindex == pindex:
-            out[iindex] = '*'
+        mark(out, indices, symbols)
         print(nextdate.strftime(shortdate), ''.join(out), sep=' ')
 
     # Write the percentages for the plot date
-    print(' ' * datepad, 'p:', ppercent,
-          ' e:', epercent, ' i:', ipercent, sep='')
+    print(' ' * datepad,
+          ' '.join(f'{symbol}:{text}'
+                   for symbol, text in zip(symbols, percents)), sep='')
 
 
-def main(year=datetime.now().year,
-         month=datetime.now().month,
-         day=datetime.now().day):
+def main(year=None, month=None, day=None):
     """ Defines the main entry point of the program.
     PARAMETERS:
     year  : the birth year of the person (0001-9999)
     month : the birth month of the person (1-12)
     day   : the birth day of the person (1-31)
     """
+    current = now()  # one reading of the clock for all of the parts
+    year = current.year if year is None else year
+    month = current.month if month is None else month
+    day = current.day if day is None else day
 
     birthdate = datetime(year, month, day)
     get_bio(birthdate=birthdate)
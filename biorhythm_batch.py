@@ -0,0 +1,279 @@
+﻿#!/usr/bin/env python3
+""" A Python module for generating biorhythm charts in batches (CLI Version).
+
+Reads a stream of people from a CSV or NDJSON (newline-delimited JSON) file,
+or from the standard input, and writes a chart or data rows for each person
+to the standard output or to one file per person in a directory.  The people
+are read, rendered, and written one at a time, so any number of people can be
+processed in fixed memory, optionally rendered in parallel worker processes.
+
+A CSV file must have a header row with a 'birth' column; an NDJSON file must
+have a 'birth' key on each line.  The optional 'name' and 'plot' columns (or
+keys) set the output file name and the plot date for each person.  Dates are
+ISO 8601 strings (YYYY-MM-DD).
+
+python -m biorhythm_batch people.csv --format text --days 14 --width 45
+python -m biorhythm_batch people.ndjson --format csv --output charts
+cat people.csv | python -m biorhythm_batch --format ndjson --workers 4
+
+For more information on biorhythms:
+https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
+
+MIT License
+
+Copyright (c) 2026 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+FOR ENTERTAINMENT PURPOSES ONLY.
+
+Create a custom script to process a batch of people from other code.
+
+#!/usr/bin/env python3
+import biorhythm_batch
+import sys
+lines = ['name,birth', 'lincoln,1809-02-12', 'gandhi,1869-10-02']
+for chunk in biorhythm_batch.process(biorhythm_batch.read_people(lines),
+                                     fmt='csv', days=3):
+    sys.stdout.write(chunk)
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import chain
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+
+from biorhythm_class import Biorhythm
+from biorhythm_cycles import now
+
+formats = {'text': '.txt', 'json': '.json', 'ndjson': '.ndjson',
+           'csv': '.csv'}  # output formats and their file extensions
+header = 'birth,plot,day,p,e,i,a\n'  # CSV header row, written once per file
+
+
+def read_people(lines):
+    """ Yields the people from the lines of a CSV or NDJSON file.
+    PARAMETERS:
+    lines : iterable of text lines, such as an open file
+    YIELDS:
+    The name (or None), birth date, and plot date (or None) of each person
+    NOTES:
+    The file is NDJSON when the first non-blank line starts with a brace,
+    otherwise it is CSV.  Raises a ValueError for a person without a valid
+    birth date.
+    """
+    lines = iter(lines)
+    first = next((line for line in lines if line.strip()), None)
+    if first is None:  # empty file
+        return
+    if first.lstrip().startswith('{'):
+        records = (json.loads(line)
+                   for line in chain([first], lines) if line.strip())
+    else:
+        records = csv.DictReader(chain([first], lines))
+    for number, record in enumerate(records, start=1):
+        try:
+            birth = datetime.fromisoformat(record['birth'])
+            plot = record.get('plot') or None
+            if plot is not None:
+                plot = datetime.fromisoformat(plot)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f'Invalid person: {number}') from None
+        yield record.get('name') or None, birth, plot
+
+
+def render(person, fmt='text', plot=None, days=14, width=45, first=True):
+    """ Renders the chart or data rows of one person.
+    PARAMETERS:
+    person : name, birth date, and plot date (or None) of the person
+    fmt    : output format, 'text', 'json', 'ndjson', or 'csv'
+    plot   : plot date, when not set for the person, default is today
+    days   : number of days to show before and after the plot date
+    width  : width of the chart in characters
+    first  : if true, include the CSV header row
+    RETURNS:
+    The rendered output (string)
+    """
+    _, birth, own = person
+    plot = own or plot or now()
+    bio = Biorhythm(birth=birth)
+    if fmt == 'text':
+        return bio.render(plot=plot, width=width, days=days)
+    if fmt == 'json':
+        return bio.json(plot=plot, days=days)
+    if fmt == 'ndjson':
+        return bio.json(plot=plot, days=days, orient='lines')
+    if fmt == 'csv':
+        out = io.StringIO()
+        if first:
+            out.write(header)
+        writer = csv.writer(out, lineterminator='\n')
+        for row in bio.iter_datarows(plot=plot, days=days):
+            cycles = row['cycles']
+            writer.writerow([row['birth'].isoformat(),
+                             row['plot'].isoformat(), row['day'],
+                             cycles['p'], cycles['e'], cycles['i'],
+                             cycles['a']])
+        return out.getvalue()
+    raise ValueError(f'Unknown output format: {fmt}')
+
+
+def get_filename(person, fmt='text', directory=''):
+    """ Gets the output file name of one person.
+    PARAMETERS:
+    person    : name, birth date, and plot date (or None) of the person
+    fmt       : output format, 'text', 'json', 'ndjson', or 'csv'
+    directory : output directory of the file
+    RETURNS:
+    The file name, by the person's name or else the birth date (YYYY.MM.DD)
+    """
+    name, birth, _ = person
+    if name:  # only the safe characters of the name are kept
+        name = re.sub(r'[^\w.-]+', '_', name).strip('._') or None
+    return os.path.join(directory,
+                        (name or f'{birth:%Y.%m.%d}') + formats[fmt])
+
+
+def process(people, fmt='text', plot=None, days=14, width=45,
+            directory=None, workers=1):
+    """ Yields the output of each person, in the order of the people.
+    PARAMETERS:
+    people    : iterable of people, see the read_people function
+    fmt       : output format, 'text', 'json', 'ndjson', or 'csv'
+    plot      : plot date, when not set for a person, default is today
+    days      : number of days to show before and after the plot date
+    width     : width of the chart in characters
+    directory : output directory of the files, or None for the output chunks
+    workers   : number of worker processes, 1 renders in this process
+    YIELDS:
+    The output chunks (string) for the standard output, or the file name of
+    each person when saved to a directory
+    NOTES:
+    Only a few people per worker are in flight at once, so the people are
+    read lazily and the output is written as soon as it is rendered.  Files
+    for people with the same name (or birth date) are overwritten.
+    """
+    if fmt not in formats:
+        raise ValueError(f'Unknown output format: {fmt}')
+    plot = plot or now()  # one plot date for the whole batch
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+
+    def results(executor):  # inner function, yields the rendered outputs
+        pending = deque()  # futures in the order of the people
+        for index, person in enumerate(people):
+            first = directory is not None or index == 0
+            args = (person, fmt, plot, days, width, first)
+            if executor is None:
+                yield person, index, render(*args)
+                continue
+            pending.append((person, index, executor.submit(render, *args)))
+            if len(pending) >= workers * 4:  # bounded, keeps memory fixed
+                person, index, future = pending.popleft()
+                yield person, index, future.result()
+        while pending:
+            person, index, future = pending.popleft()
+            yield person, index, future.result()
+
+    def chunks(executor):  # inner function, yields the output chunks
+        count = 0
+        for person, index, out in results(executor):
+            count += 1
+            if directory is not None:
+                filename = get_filename(person, fmt=fmt, directory=directory)
+                with open(filename, 'w', encoding='utf-8') as file:
+                    file.write(out)
+                    if fmt == 'json':
+                        file.write('\n')
+                yield filename + '\n'
+            elif fmt == 'json':  # one array of people, each an array of rows
+                yield ('[\n' if index == 0 else ',\n') + out
+            else:
+                yield out
+        if directory is None and fmt == 'json':
+            yield '\n]\n' if count else '[]\n'
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from chunks(executor)
+    else:
+        yield from chunks(None)
+
+
+def main(argv=None):
+    """ Defines the main entry point of the program.
+    PARAMETERS:
+    argv : command line arguments, default is the program arguments
+    RETURNS:
+    The exit status of the program
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m biorhythm_batch',
+        description='Generates biorhythm charts for a CSV or NDJSON file '
+                    'of people (FOR ENTERTAINMENT PURPOSES ONLY).')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='CSV or NDJSON file of people, default is the '
+                             'standard input')
+    parser.add_argument('--format', choices=list(formats), default='text',
+                        help='output format, default is text')
+    parser.add_argument('--output', metavar='DIRECTORY',
+                        help='save one file per person to a directory, '
+                             'default is the standard output')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='number of worker processes, default is 1')
+    parser.add_argument('--plot', type=datetime.fromisoformat,
+                        metavar='YYYY-MM-DD',
+                        help='plot date, default is today')
+    parser.add_argument('--days', type=int, default=14,
+                        help='number of days before and after the plot date')
+    parser.add_argument('--width', type=int, default=45,
+                        help='width of the text chart in characters')
+    args = parser.parse_args(argv)
+    file = None
+    try:
+        if args.input == '-':
+            file = sys.stdin
+        else:
+            file = open(args.input, encoding='utf-8-sig', newline='')
+        for chunk in process(read_people(file), fmt=args.format,
+                             plot=args.plot, days=args.days,
+                             width=args.width, directory=args.output,
+                             workers=args.workers):
+            sys.stdout.write(chunk)
+        sys.stdout.flush()
+    except (OSError, ValueError) as error:
+        print(f'{parser.prog}: error: {error}', file=sys.stderr)
+        return 1
+    finally:
+        if file is not None and file is not sys.stdin:
+            file.close()
+    return 0
+
+
+if __name__ == '__main__':  # module can be imported or run with python -m
+    sys.exit(main())
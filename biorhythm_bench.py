@@ -0,0 +1,384 @@
+﻿#!/usr/bin/env python3
+""" A Python module for benchmarking the biorhythm charts and data paths.
+
+Times every chart renderer and data path of the biorhythm modules against the
+same fixed-seed batch of people, for small and large charts, and reports the
+rows per second, bytes per second, and peak memory of each, along with the
+import time of each module.  The results are written as JSON, so the results
+of two versions can be compared to find regressions.
+
+python -m biorhythm_bench --people 50 --output before.json
+python -m biorhythm_bench --people 50 --output after.json --compare before.json
+
+The console output of each renderer is counted and discarded, not printed.
+The Matplotlib renderers are skipped when NumPy or Matplotlib are missing.
+
+MIT License
+
+Copyright (c) 2026 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+FOR ENTERTAINMENT PURPOSES ONLY.
+
+Create a custom script to time one case in a larger batch.
+
+#!/usr/bin/env python3
+import biorhythm_bench
+for result in biorhythm_bench.run(people=500, cases=['Biorhythm.json']):
+    print(result['case'], result['size'], round(result['rows_per_sec']))
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+sizes = {'small': {'days': 7, 'width': 45, 'rows': 21},
+         'large': {'days': 182, 'width': 121, 'rows': 61}}  # chart sizes
+modules = ['biorhythm_cycles', 'biorhythm', 'biorhythm_mini', 'bio',
+           'bio_horizonal', 'bio_detail', 'biorhythm_class',
+           'biorhythm_plot']  # modules for the import times
+
+
+class Sink:
+    """ A file-like object that counts the bytes written and discards them."""
+
+    def __init__(self):
+        """ Initializes an empty sink."""
+        self.bytes = 0
+
+    def write(self, text):
+        """ Counts the UTF-8 bytes of the text."""
+        self.bytes += len(text.encode('utf-8'))
+        return len(text)
+
+    def flush(self):
+        """ Does nothing, nothing is buffered."""
+
+
+def get_people(count=50, seed=1809):
+    """ Gets a reproducible batch of people.
+    PARAMETERS:
+    count : number of people
+    seed  : seed of the random number generator
+    RETURNS:
+    The birth date and plot date (datetime objects) of each person
+    """
+    rng = random.Random(seed)
+    people = []
+    for _ in range(count):
+        birth = datetime(1900, 1, 1) + timedelta(days=rng.randrange(36525))
+        plot = birth + timedelta(days=rng.randrange(3650, 32873))
+        people.append((birth, plot))
+    return people
+
+
+def get_cases():
+    """ Gets the benchmark cases.
+    RETURNS:
+    The name and factory of each case, in the order they are run
+    NOTES:
+    Each factory takes the people, the chart size, and the sink, prepares
+    everything that must not be timed, and returns the function to time.
+    The timed function returns the number of data rows it produced.
+    """
+    def biorhythm_get_bio(people, days, width, rows, sink):
+        from biorhythm import get_bio
+
+        def run():
+            for birth, plot in people:
+                get_bio(birthdate=birth, plotdate=plot, width=width,
+                        days=2 * days + 1)
+            return len(people) * (2 * days + 1)
+        return run
+
+    def biorhythm_mini_get_bio(people, days, width, rows, sink):
+        from biorhythm_mini import get_bio
+
+        def run():
+            for birth, plot in people:
+                get_bio(birth=birth, plot=plot, width=width, days=days,
+                        file=sink)
+            return len(people) * (2 * days + 1)
+        return run
+
+    def bio_get_bio(people, days, width, rows, sink):
+        from bio import get_bio
+        dates = [(birth.date(), plot.date()) for birth, plot in people]
+
+        def run():
+            for birth, plot in dates:
+                get_bio(birth=birth, plot=plot, width=width, days=days)
+            return len(dates) * (2 * days + 1)
+        return run
+
+    def bio_horizonal_get_bio(people, days, width, rows, sink):
+        from bio_horizonal import get_bio
+        dates = [(birth.date(), plot.date()) for birth, plot in people]
+
+        def run():
+            for birth, plot in dates:
+                get_bio(birth=birth, plot=plot, rows=rows, days=days)
+            return len(dates) * (2 * days + 1)
+        return run
+
+    def bio_detail_plot_chart(people, days, width, rows, sink):
+        from bio_detail import plot_chart
+        dates = [(birth.date(), plot.date()) for birth, plot in people]
+
+        def run():
+            for birth, plot in dates:
+                plot_chart(birth=birth, plot=plot, width=width, days=days)
+            return len(dates) * (2 * days + 1)
+        return run
+
+    def bio_detail_get_data(people, days, width, rows, sink):
+        from bio_detail import get_data
+        dates = [(birth.date(), plot.date()) for birth, plot in people]
+
+        def run():
+            return sum(len(get_data(birth=birth, plot=plot, days=days))
+                       for birth, plot in dates)
+        return run
+
+    def biorhythm_print(people, days, width, rows, sink):
+        from biorhythm_class import Biorhythm
+        bios = [(Biorhythm(birth=birth), plot) for birth, plot in people]
+
+        def run():
+            for bio, plot in bios:
+                bio.print(plot=plot, width=width, days=days)
+            return len(bios) * (2 * days + 1)
+        return run
+
+    def biorhythm_datarows(people, days, width, rows, sink):
+        from biorhythm_class import Biorhythm
+        bios = [(Biorhythm(birth=birth), plot) for birth, plot in people]
+
+        def run():
+            return sum(len(bio.datarows(plot=plot, days=days))
+                       for bio, plot in bios)
+        return run
+
+    def biorhythm_json(people, days, width, rows, sink):
+        from biorhythm_class import Biorhythm
+        bios = [(Biorhythm(birth=birth), plot) for birth, plot in people]
+
+        def run():
+            for bio, plot in bios:
+                sink.write(bio.json(plot=plot, days=days))
+            return len(bios) * (2 * days + 1)
+        return run
+
+    def biorhythm_load(people, days, width, rows, sink):
+        from biorhythm_class import Biorhythm
+        bio = Biorhythm()
+        data = [Biorhythm(birth=birth).json(plot=plot, days=days)
+                for birth, plot in people]
+
+        def run():
+            return sum(len(bio.load(text)) for text in data)
+        return run
+
+    def biorhythm_plot_get_bio(people, days, width, rows, sink):
+        import matplotlib  # optional, skipped when missing
+        matplotlib.use('Agg')  # renders off screen, no windows
+        import matplotlib.pyplot as plt
+        import numpy as np  # optional, skipped when missing
+        from biorhythm_plot import get_bio
+        dates = [(np.datetime64(birth.date()), np.datetime64(plot.date()))
+                 for birth, plot in people]
+
+        def run():
+            for birth, plot in dates:
+                get_bio(birthdate=birth, plotdate=plot, physical=True,
+                        emotional=True, intellectual=True,
+                        days=2 * days + 1, block=False)
+                plt.close('all')
+            return len(dates) * (2 * days + 1)
+        return run
+
+    def biorhythm_plot_get_batch(people, days, width, rows, sink):
+        import numpy as np  # optional, skipped when missing
+        from biorhythm_plot import get_batch
+        births = np.array([birth.date() for birth, _ in people],
+                          dtype='datetime64[D]')
+        offsets = np.arange(-days, days + 1)
+        plots = np.array([plot.date() for _, plot in people],
+                         dtype='datetime64[D]')[:, None] + offsets
+
+        def run():
+            return get_batch(births, plots)[0].size
+        return run
+    return [('biorhythm.get_bio', biorhythm_get_bio),
+            ('biorhythm_mini.get_bio', biorhythm_mini_get_bio),
+            ('bio.get_bio', bio_get_bio),
+            ('bio_horizonal.get_bio', bio_horizonal_get_bio),
+            ('bio_detail.plot_chart', bio_detail_plot_chart),
+            ('bio_detail.get_data', bio_detail_get_data),
+            ('Biorhythm.print', biorhythm_print),
+            ('Biorhythm.datarows', biorhythm_datarows),
+            ('Biorhythm.json', biorhythm_json),
+            ('Biorhythm.load', biorhythm_load),
+            ('biorhythm_plot.get_bio', biorhythm_plot_get_bio),
+            ('biorhythm_plot.get_batch', biorhythm_plot_get_batch)]
+
+
+def run(people=50, seed=1809, repeat=5, cases=None):
+    """ Yields the results of the benchmark cases.
+    PARAMETERS:
+    people : number of people in the batch
+    seed   : seed of the random number generator for the people
+    repeat : number of timed runs of each case, the fastest is reported
+    cases  : names of the cases to run, default is all of them
+    YIELDS:
+    The result (object) of each case and chart size, or the reason a case
+    was skipped
+    """
+    batch = get_people(count=people, seed=seed)
+    for name, factory in get_cases():
+        if cases and name not in cases:
+            continue
+        for size, params in sizes.items():
+            result = {'case': name, 'size': size, 'people': people, **params}
+            sink = Sink()
+            try:
+                func = factory(batch, sink=sink, **params)
+            except ImportError as error:  # optional dependency is missing
+                result['skipped'] = str(error)
+                yield result
+                continue
+            with redirect_stdout(sink):
+                rows = func()  # warm-up run, counts the rows and bytes
+                size_bytes = sink.bytes
+                seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+                tracemalloc.start()
+                func()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            result.update({'rows': rows, 'bytes': size_bytes,
+                           'seconds': seconds,
+                           'rows_per_sec': rows / seconds,
+                           'bytes_per_sec': size_bytes / seconds,
+                           'peak_bytes': peak})
+            yield result
+
+
+def get_import_times(repeat=5):
+    """ Gets the import time of each module, in a new process per import.
+    PARAMETERS:
+    repeat : number of imports of each module, the fastest is reported
+    RETURNS:
+    The seconds to import each module (None when it cannot be imported)
+    """
+    code = ('import time; start = time.perf_counter(); import {name}; '
+            'print(time.perf_counter() - start)')
+    folder = os.path.dirname(os.path.abspath(__file__))
+    times = {}
+    for name in modules:
+        best = None
+        for _ in range(repeat):
+            command = [sys.executable, '-c', code.format(name=name)]
+            done = subprocess.run(command, cwd=folder, capture_output=True,
+                                  text=True)
+            if done.returncode != 0:  # optional dependency is missing
+                break
+            seconds = float(done.stdout)
+            best = seconds if best is None else min(best, seconds)
+        times[name] = best
+    return times
+
+
+def main(argv=None):
+    """ Defines the main entry point of the program.
+    PARAMETERS:
+    argv : command line arguments, default is the program arguments
+    RETURNS:
+    The exit status of the program
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m biorhythm_bench',
+        description='Benchmarks the biorhythm charts and data paths.')
+    parser.add_argument('--people', type=int, default=50,
+                        help='number of people in the batch, default is 50')
+    parser.add_argument('--seed', type=int, default=1809,
+                        help='seed of the random people, default is 1809')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of timed runs of each case, default is 5')
+    parser.add_argument('--case', action='append', dest='cases',
+                        metavar='NAME', help='run only the named case, '
+                        'can be repeated, such as Biorhythm.json')
+    parser.add_argument('--output', metavar='FILE',
+                        help='save the JSON results to a file, default is '
+                             'the standard output')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the rows per second with the JSON '
+                             'results of an earlier run')
+    args = parser.parse_args(argv)
+    results = {'python': platform.python_version(),
+               'platform': platform.platform(),
+               'date': datetime.now().isoformat(timespec='seconds'),
+               'people': args.people, 'seed': args.seed,
+               'repeat': args.repeat, 'cases': [],
+               'imports': get_import_times(repeat=args.repeat)}
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = {(case['case'], case['size']): case
+                        for case in json.load(file)['cases']}
+    for result in run(people=args.people, seed=args.seed,
+                      repeat=args.repeat, cases=args.cases):
+        results['cases'].append(result)
+        line = f"{result['case']:<26} {result['size']:<6}"
+        if 'skipped' in result:
+            line += f" skipped: {result['skipped']}"
+        else:
+            line += (f" {result['rows_per_sec']:>12,.0f} rows/s"
+                     f" {result['bytes_per_sec']:>14,.0f} bytes/s"
+                     f" {result['peak_bytes']:>12,} peak")
+            old = baseline.get((result['case'], result['size']), {})
+            if 'rows_per_sec' in old:  # >1.00 is faster than the baseline
+                line += f" {result['rows_per_sec'] / old['rows_per_sec']:.2f}x"
+        print(line, file=sys.stderr)
+    for name, seconds in results['imports'].items():
+        imported = 'skipped' if seconds is None else f'{seconds * 1000:.1f} ms'
+        print(f'import {name:<20} {imported}', file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=4)
+            file.write('\n')
+    else:
+        json.dump(results, sys.stdout, indent=4)
+        sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':  # module can be imported or run with python -m
+    sys.exit(main())
@@ -49,38 +49,313 @@ day = int(input('Enter your birth DAY (1-31): '))
 Biorhythm.from_ymd(year, month, day).write_year()
 input('Press ENTER to Continue: ')
 
+Create a custom script to hold a year of compact data rows in memory.
+
+#!/usr/bin/env python3
+from biorhythm_class import Biorhythm
+from datetime import datetime
+rows = Biorhythm.from_ymd(1809, 2, 12).datarows(plot=datetime(1863, 7, 2),
+                                                days=182, compact=True)
+print(len(rows), max(rows.p))  # value arrays, 8 bytes per value
+print(rows[182])  # converted to the nested data row (object) on demand
+
+Create a custom script to generate several years for several people at once.
+
+#!/usr/bin/env python3
+from biorhythm_class import Biorhythm
+from datetime import datetime
+if __name__ == '__main__':  # required by the worker processes
+    births = [datetime(1809, 2, 12), datetime(1908, 9, 15)]
+    for filename in Biorhythm.write_years(births, years=[2025, 2026],
+                                          directory='charts', workers=4):
+        print('Saved:', filename)
+
+Create a custom script to keep a chart on screen, moving it along every day.
+
+#!/usr/bin/env python3
+from biorhythm_class import Biorhythm
+import time
+window = Biorhythm.from_ymd(1809, 2, 12).window()  # today, per the clock
+while True:
+    window.print()
+    time.sleep(24 * 60 * 60)  # one day
+    window.advance()  # only renders the new and highlighted rows
+
 If you enjoy this software, please do something kind for free.
 
 Please consider giving to cancer research.
 https://braintumor.org/
 https://www.cancer.org/
 """
-from datetime import datetime, timedelta
-from math import floor, pi, sin
+from array import array
+from collections import OrderedDict, deque
+from datetime import date, datetime, timedelta
+from math import floor, gcd, pi, sin
 import json
+import os
 import sys
+import threading
+
+from biorhythm_cycles import (get_cycles, get_ordinal, get_phase_rows,
+                              get_revision, get_table, now, phases_enabled,
+                              to_zone, today)
+
+
+class Datarows:
+    """ A class for holding compact data rows for consecutive plot dates.
+    ATTRIBUTES:
+    birth : birth date of the person
+    plot  : plot date of the first data row
+    day   : number of days since birth of the first data row
+    p     : physical values (array)
+    e     : emotional values (array)
+    i     : intellectual values (array)
+    a     : average values (array)
+    NOTES:
+    Each data row only uses the memory of its four values; the plot date and
+    number of days follow from the position of the data row.  Indexing or
+    iterating returns the data rows (object) in the usual nested shape.
+    """
+    __slots__ = ('birth', 'plot', 'day', 'p', 'e', 'i', 'a')
+
+    def __init__(self, birth, plot, day, typecode='d'):
+        """ Initializes empty data rows.
+        PARAMETERS:
+        birth    : birth date of the person
+        plot     : plot date of the first data row
+        day      : number of days since birth of the first data row
+        typecode : array type code of the values, 'd' (float64) or 'f'
+        """
+        self.birth = birth
+        self.plot = plot
+        self.day = day
+        self.p, self.e, self.i, self.a = (array(typecode) for _ in range(4))
+
+    def __getitem__(self, index):
+        """ Returns the data row (object) at an index, or list for a slice."""
+        if isinstance(index, slice):
+            return [self[n] for n in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('data row index out of range')
+        return {'birth': self.birth,
+                'plot': self.plot + timedelta(days=index),
+                'day': self.day + index,
+                'cycles': {'p': self.p[index], 'e': self.e[index],
+                           'i': self.i[index], 'a': self.a[index]}}
+
+    def __len__(self):
+        """ Returns the number of data rows."""
+        return len(self.p)
+
+    def __repr__(self):
+        """ Returns a formal string representation."""
+        return (f'{type(self).__name__}(birth={self.birth!r}, '
+                f'plot={self.plot!r}, day={self.day!r}, rows={len(self)})')
+
+
+class Window:
+    """ A class for a chart that slides along the dates one day at a time.
+    ATTRIBUTES:
+    plot : plot date of the chart, its row is highlighted
+    days : number of days to show before and after the plot date
+    NOTES:
+    The rendered rows are kept in a ring buffer, so advancing the chart only
+    renders the rows entering the chart and the two highlighted rows.  Create
+    the window with the Biorhythm window method.
+    """
+
+    def __init__(self, header, row, footer, plot, days):
+        """ Initializes a chart window.
+        PARAMETERS:
+        header : header lines of the chart
+        row    : function rendering the row of a date for a plot date
+        footer : function returning the footer lines for a plot date
+        plot   : plot date of the chart
+        days   : number of days to show before and after the plot date
+        """
+        self.plot = plot
+        self.days = days
+        self.__header = header
+        self.__row = row
+        self.__footer = footer
+        self.__rows = deque(maxlen=2 * days + 1)  # oldest rows drop off
+        self.__fill()
+
+    def __fill(self):
+        """ Renders all of the rows for the plot date."""
+        self.__rows.clear()
+        for d in range(-self.days, self.days + 1):
+            self.__rows.append(self.__row(self.plot + timedelta(days=d),
+                                          self.plot))
+
+    def __repr__(self):
+        """ Returns a formal string representation."""
+        return (f'{type(self).__name__}(plot={self.plot!r}, '
+                f'days={self.days!r})')
+
+    def advance(self, days=1):
+        """ Moves the chart along the dates.
+        PARAMETERS:
+        days : number of days to move, negative moves back
+        """
+        old, self.plot = self.plot, self.plot + timedelta(days=days)
+        if abs(days) >= len(self.__rows):  # no rows left to keep
+            self.__fill()
+            return
+        for d in range(1, abs(days) + 1):
+            if days > 0:  # entering at the end, leaving at the start
+                self.__rows.append(self.__row(
+                    old + timedelta(days=self.days + d), self.plot))
+            else:  # entering at the start, leaving at the end
+                self.__rows.appendleft(self.__row(
+                    old - timedelta(days=self.days + d), self.plot))
+        index = self.days - days  # position of the old plot date
+        if 0 <= index < len(self.__rows):
+            self.__rows[index] = self.__row(old, self.plot)
+        self.__rows[self.days] = self.__row(self.plot, self.plot)
+
+    def render(self):
+        """ Returns the chart (string).
+        RETURNS:
+        The chart text, exactly as printed by the Biorhythm print method
+        """
+        return '\n'.join([*self.__header, *self.__rows,
+                          *self.__footer(self.plot), ''])
+
+    def print(self):
+        """ Prints the chart to the console."""
+        sys.stdout.write(self.render())
+        if Biorhythm.flush:
+            sys.stdout.flush()
 
 
 class Biorhythm:
     """ A class for generating a biorhythm chart.
     ATTRIBUTES:
-    pwave    : number of days for the physical cycle
-    ewave    : number of days for the emotional cycle
-    iwave    : number of days for the intellectual cycle
+    pwave    : number of days for the physical cycle, or None
+    ewave    : number of days for the emotional cycle, or None
+    iwave    : number of days for the intellectual cycle, or None
+    spwave   : number of days for the secondary spiritual cycle, or None
+    inwave   : number of days for the secondary intuition cycle, or None
+    awwave   : number of days for the secondary awareness cycle, or None
+    aewave   : number of days for the secondary aesthetic cycle, or None
     encoding : output file character encoding
     flush    : if true, commit the file output immediately without buffering
+    cache    : maximum number of cached charts and data rows, 0 disables
+    NOTES:
+    The default birth and plot dates are read from the clock on every call
+    (see biorhythm_cycles.set_clock), never frozen when the module is
+    imported.  The cache is cleared when the clock reaches the next day.
+    The charts and data rows always hold the three primary cycles.  A
+    wavelength of None (the default) takes the current period of the shared
+    cycle registry, so registry changes apply to this class as well; a
+    number set on the attribute overrides the registry for this class only.
+    The event searches default to the registry's active set.
     """
-    pwave, ewave, iwave = 23, 28, 33  # physical, emotional, intellectual
+    pwave = None  # None takes the current period of the cycle registry
+    ewave = None
+    iwave = None
+    spwave = None  # secondary cycles
+    inwave = None
+    awwave = None
+    aewave = None
     encoding = 'utf_8'  # all languages
     flush = False  # true flushes output, false buffers output
+    cache = 0  # opt-in, least recently used entries are evicted first
+    __cache = OrderedDict()  # cached results, oldest entries first
+    __hits = __misses = 0  # cache statistics
+    __lock = threading.Lock()  # guards the cache across threads
+    __day = None  # day of the cached results, cleared on the next day
+    __bound = None  # wavelength attributes and registry revision, bound
+    __tables = ((None,) * 3, None, None, None, None)  # see __bind_tables
 
-    def __init__(self, birth=datetime.now()):
+    def __init__(self, birth=None, tz=None):
         """ Initializes a chart.
         PARAMETERS:
         birth : birth date of the person
+        tz    : time zone (tzinfo) in which to count and show the days, aware
+                dates are converted to it first, default is each date's own
         """
+        birth = now() if birth is None else birth
+        self.__tz = tz
         self.birth = birth
 
+    @property
+    def birth(self):
+        """ Gets or sets the birth date of the person."""
+        return self.__birth
+
+    @birth.setter
+    def birth(self, birth):
+        self.__birth = birth
+        self.__zoned = self.__to_zone(d=birth)  # shown in the chart time zone
+        self.__ordinal = self.__get_ordinal(d=birth)  # counted once
+
+    @property
+    def tz(self):
+        """ Gets or sets the time zone in which to count the days."""
+        return self.__tz
+
+    @tz.setter
+    def tz(self, tz):
+        self.__tz = tz
+        self.__zoned = self.__to_zone(d=self.__birth)  # shown in the zone
+        self.__ordinal = self.__get_ordinal(d=self.__birth)  # counted once
+
+    def __cache_key(self, *args):
+        """ Gets the cache key for a result of this chart.
+        PARAMETERS:
+        args : name of the result, followed by its parameters
+        RETURNS:
+        The cache key, including the birth date, time zone, cycle
+        wavelengths, and registry revision
+        """
+        return (*args, self.birth, self.tz, Biorhythm.pwave, Biorhythm.ewave,
+                Biorhythm.iwave, get_revision())
+
+    @classmethod
+    def __cache_get(cls, key):
+        """ Gets a cached result, marking it as the most recently used.
+        PARAMETERS:
+        key : cache key of the result
+        RETURNS:
+        The cached result, or None when caching is disabled or missed
+        """
+        if Biorhythm.cache < 1:  # disabled
+            return None
+        day = today()
+        with Biorhythm.__lock:
+            if day != Biorhythm.__day:  # day boundary, drop the old results
+                Biorhythm.__cache.clear()
+                Biorhythm.__day = day
+            value = Biorhythm.__cache.get(key)
+            if value is None:
+                Biorhythm.__misses += 1
+            else:
+                Biorhythm.__hits += 1
+                Biorhythm.__cache.move_to_end(key)
+            return value
+
+    @classmethod
+    def __cache_set(cls, key, value):
+        """ Caches a result, evicting the least recently used results.
+        PARAMETERS:
+        key   : cache key of the result
+        value : result to cache
+        RETURNS:
+        The result
+        """
+        if Biorhythm.cache < 1:  # disabled
+            return value
+        with Biorhythm.__lock:
+            Biorhythm.__cache[key] = value
+            Biorhythm.__cache.move_to_end(key)
+            while len(Biorhythm.__cache) > Biorhythm.cache:
+                Biorhythm.__cache.popitem(last=False)
+        return value
+
     def __calculate(self, n):
         """ Calculates the published formula values.
         PARAMETERS:
@@ -89,20 +364,136 @@ class Biorhythm:
         The physical, emotional, intellectual, and average values
         """
         # sine models -/+ percentages of distance from middle point of chart
-        p = sin(2 * pi * n / Biorhythm.pwave)  # physical
-        e = sin(2 * pi * n / Biorhythm.ewave)  # emotional
-        i = sin(2 * pi * n / Biorhythm.iwave)  # intellectual
-        a = (p + e + i) / 3  # average
-        return p, e, i, a
+        # cycles repeat, so only the day within each cycle must be looked up
+        if Biorhythm.__bound != (Biorhythm.pwave, Biorhythm.ewave,
+                                 Biorhythm.iwave, get_revision()):
+            Biorhythm.__bind_tables()  # rebound when overridden or registered
+        waves, ptable, etable, itable, rows = Biorhythm.__tables
+        if rows is not None:  # phase state within the shared phase table
+            row = rows[n % len(rows)]
+            if row is not None:  # zero crossings use the sine tables
+                return row
+        pwave, ewave, iwave = waves
+        # zero crossings use the formula, see biorhythm_cycles.get_table
+        p = ptable[n % pwave] or sin(2 * pi * n / pwave)  # physical
+        e = etable[n % ewave] or sin(2 * pi * n / ewave)  # emotional
+        i = itable[n % iwave] or sin(2 * pi * n / iwave)  # intellectual
+        return p, e, i, (p + e + i) / 3  # average
+
+    @classmethod
+    def __bind_tables(cls):
+        """ Binds the tables of the current cycle wavelengths.
+        NOTES:
+        The bound tables are the wavelengths, the physical, emotional, and
+        intellectual sine tables, and the phase table rows, which are None
+        unless the phase table is in use (see biorhythm_cycles.use_phases).
+        They are rebound when a wavelength attribute or the registry changes.
+        """
+        bound = (Biorhythm.pwave, Biorhythm.ewave, Biorhythm.iwave,
+                 get_revision())
+        waves = tuple(cls.__get_waves(
+            ('physical', 'emotional', 'intellectual')).values())
+        rows = get_phase_rows(waves) if phases_enabled() else None
+        Biorhythm.__tables = (waves, *(get_table(wave) for wave in waves),
+                              rows)
+        Biorhythm.__bound = bound  # last, after the tables are complete
+
+    @classmethod
+    def __get_waves(cls, cycles):
+        """ Gets the number of days for each of the named cycles.
+        PARAMETERS:
+        cycles : names of the cycles, such as 'physical' or 'aesthetic',
+                 default is the active set of the cycle registry
+        RETURNS:
+        The number of days for each cycle, keyed by the cycle name, taken
+        from the wavelength attributes that are set, otherwise the registry
+        """
+        if cycles is None:
+            cycles = [cycle.name for cycle in get_cycles(enabled=True)]
+        waves = {cycle.name: cycle.period for cycle in get_cycles()}
+        overrides = {'physical': Biorhythm.pwave,  # class overrides
+                     'emotional': Biorhythm.ewave,
+                     'intellectual': Biorhythm.iwave,
+                     'spiritual': Biorhythm.spwave,
+                     'intuition': Biorhythm.inwave,
+                     'awareness': Biorhythm.awwave,
+                     'aesthetic': Biorhythm.aewave}
+        waves.update({cycle: wave for cycle, wave in overrides.items()
+                      if wave is not None})
+        for cycle in cycles:
+            if cycle not in waves:
+                raise ValueError(f'Unknown cycle: {cycle}')
+        return {cycle: waves[cycle] for cycle in cycles}
+
+    @classmethod
+    def __find_events(cls, event, low, high, wave):
+        """ Gets the days of a named cycle event, without any sines.
+        PARAMETERS:
+        event : name of the event, 'critical', 'peak', or 'trough'
+        low   : first number of days since birth to include
+        high  : last number of days since birth to include
+        wave  : number of days for the cycle
+        RETURNS:
+        The numbers of days since birth of the events, in ascending order
+        """
+        if event == 'critical':  # zero crossings, every half cycle
+            return cls.__get_events(low, high, wave, 0, 2, 0)
+        if event == 'peak':  # a quarter into each cycle, nearest day
+            return cls.__get_events(low, high, 4 * wave, wave, 4, 2)
+        if event == 'trough':  # three quarters into each cycle, nearest day
+            return cls.__get_events(low, high, 4 * wave, 3 * wave, 4, 2)
+        raise ValueError(f'Unknown cycle event: {event}')
+
+    @staticmethod
+    def __get_events(low, high, step, shift, parts, offset):
+        """ Gets the days of a recurring cycle event, without any sines.
+        PARAMETERS:
+        low    : first number of days since birth to include
+        high   : last number of days since birth to include
+        step   : days between the events, in parts of a day
+        shift  : days to the first event after birth, in parts of a day
+        parts  : number of parts each day is divided into
+        offset : rounding offset added before flooring, in parts of a day
+        RETURNS:
+        The numbers of days since birth of the events, in ascending order
+        NOTES:
+        Event k occurs at exactly (k * step + shift) / parts days, so the day
+        on which it falls, and the range of k values between the low and high
+        days, follow from integer arithmetic alone.
+        """
+        first = -((shift + offset - low * parts) // step)  # ceiling
+        last = (high * parts + parts - 1 - shift - offset) // step
+        return array('q', ((k * step + shift + offset) // parts
+                           for k in range(first, last + 1)))
 
     def __get_days(self, d):
         """ Gets the number of days since birth for a date.
         PARAMETERS:
         d : date for which to get the number of days since birth
         RETURNS:
-        The number of days since birth
+        The number of days since birth, counting calendar days, so any times
+        of the day are ignored
         """
-        return (d - self.birth).days
+        return self.__get_ordinal(d=d) - self.__ordinal
+
+    def __get_ordinal(self, d):
+        """ Gets the day number (proleptic Gregorian ordinal) of a date.
+        PARAMETERS:
+        d : date or datetime, converted to the chart time zone when aware
+        RETURNS:
+        The day number, 1 for January 1 of year 1
+        """
+        return get_ordinal(d, tz=self.__tz)
+
+    def __to_zone(self, d):
+        """ Converts a date to the chart time zone.
+        PARAMETERS:
+        d : date or datetime, converted to the chart time zone when aware
+        RETURNS:
+        The date as shown in the charts and data rows, the same calendar day
+        on which its number of days since birth is counted
+        """
+        return to_zone(d, tz=self.__tz)
 
     def __get_detail(self, n):
         """ Gets the percentage details for the number of days since birth.
@@ -120,10 +511,20 @@ class Biorhythm:
         d : date for which to get the reporting line
         RETURNS:
         The reporting line
+        NOTES:
+        The line only depends on the calendar day, so it is cached by the day
+        number, not by the time of the day.
         """
-        n = self.__get_days(d=d)  # number of days since birth
+        ordinal = self.__get_ordinal(d=d)  # day in the chart time zone
+        key = self.__cache_key('line', ordinal)
+        line = self.__cache_get(key)
+        if line is not None:
+            return line
+        n = ordinal - self.__ordinal  # number of days since birth
         out = self.__get_detail(n=n)  # percentage details
-        return f'{d:%Y-%b-%d} Day:{n:,} [ {out} ]'  # formatted date, commas
+        d = date.fromordinal(ordinal)
+        line = f'{d:%Y-%b-%d} Day:{n:,} [ {out} ]'  # formatted date, commas
+        return self.__cache_set(key, line)
 
     def __plot(self, plot, width, days, detail, file, flush):
         """ Plots a chart of physical, emotional, and intellectual cycles.
@@ -135,59 +536,253 @@ class Biorhythm:
         file   : object with a write method, such as the console or a file
         flush  : if true, commit the file output immediately without buffering
         """
+        file.write(self.__render(plot=plot, width=width, days=days,
+                                 detail=detail))  # single write per chart
+        if flush:
+            file.flush()
+
+    def __render(self, plot, width, days, detail):
+        """ Renders a chart of physical, emotional, and intellectual cycles.
+        PARAMETERS:
+        plot   : plot date of the chart
+        width  : width of the chart in characters
+        days   : number of days to show before and after the plot date
+        detail : if true, show the percentage details for the plot date
+        RETURNS:
+        The chart text, every line ending with a newline
+        """
+        # the chart only shows calendar days, so it is cached by the day number
+        key = self.__cache_key('chart', self.__get_ordinal(d=plot), width,
+                               days, detail)
+        chart = self.__cache_get(key)
+        if chart is not None:
+            return chart
         width = 25 if width < 25 else width  # minimum width of chart
-        midwidth = floor(width / 2)  # middle point of chart, distance to edge
-        print('BIORHYTHM for Birth Date:', f'{self.birth:%A, %d %B %Y}',
-              file=file, flush=flush)
-        print('p=physical, e=emotional, i=intellectual, a=average',
-              'for days since birth',
-              file=file, flush=flush)
-        print(f'{" ": <15}',  # left-justify date width
-              f'{"PASSIVE  CRITICAL  ACTIVE": ^{width}}',  # center over chart
-              f'{" ": >10}',  # right-justify day width
-              file=file, flush=flush)
-        print(f'{"Date": <15}',  # left-justify date width
-              f'-100% {"=" * (width - 12)} +100%',  # 12 for literals/spaces
-              f'{"Day": >10}',  # right-justify day width
-              file=file, flush=flush)
+        templates = self.__get_templates(width=width)
+        out = templates[0][:]  # row buffer, reused for every row of the chart
+        lines = self.__get_header(width=width)  # joined once, after all lines
         dates = (plot + timedelta(days=d) for d in range(-days, days + 1))
         for d in dates:  # generator expression above yields dates lazily
-            n = self.__get_days(d=d)  # number of days since birth
-            _p, _e, _i, _a = self.__calculate(n=n)  # percentage values
-            p = midwidth + floor(_p * (midwidth - 1))  # middle point to edges
-            e = midwidth + floor(_e * (midwidth - 1))
-            i = midwidth + floor(_i * (midwidth - 1))
-            a = midwidth + floor(_a * (midwidth - 1))
-            out = list(('-' if d.date() == plot.date() else ' ') * width)
-            out[midwidth] = ':'
-            out[p] = '*' if p in {e, i, a} else 'p'  # '*' for overlap values
-            out[e] = '*' if e in {i, a, p} else 'e'
-            out[i] = '*' if i in {a, p, e} else 'i'
-            out[a] = '*' if a in {p, e, i} else 'a'
-            print(f'{d:%a %d %b %Y}',  # formatted date
-                  ''.join(out),  # chart output
-                  f'{n: >10,}',  # right-justify day width, commas
-                  file=file, flush=flush)
+            lines.append(self.__get_row(d=d, plot=plot, width=width,
+                                        templates=templates, out=out))
         if detail:  # detail outputs percentages for plot date
-            n = self.__get_days(d=plot)  # number of days since birth
-            out = self.__get_detail(n=n)  # percentage details
-            if len(out) <= width:  # check for fit
-                print(f'{"Outlook Today": >15}',  # right-justify date width
-                      f'{out: ^{width}}',  # center under chart
-                      f'{" ": >10}',  # right-justify day width
-                      file=file, flush=flush)
+            lines.extend(self.__get_footer(plot=plot, width=width))
+        lines.append('')  # trailing newline
+        return self.__cache_set(key, '\n'.join(lines))
+
+    def __get_header(self, width):
+        """ Gets the header lines of a chart.
+        PARAMETERS:
+        width : width of the chart in characters (at least 25)
+        RETURNS:
+        The list of header lines
+        """
+        lines = []
+        lines.append(f'BIORHYTHM for Birth Date: {self.__zoned:%A, %d %B %Y}')
+        lines.append('p=physical, e=emotional, i=intellectual, a=average '
+                     'for days since birth')
+        lines.append(f'{" ": <15} '  # left-justify date width
+                     f'{"PASSIVE  CRITICAL  ACTIVE": ^{width}} '  # center
+                     f'{" ": >10}')  # right-justify day width
+        lines.append(f'{"Date": <15} '  # left-justify date width
+                     f'-100% {"=" * (width - 12)} +100% '  # 12 for literals
+                     f'{"Day": >10}')  # right-justify day width
+        return lines
+
+    @staticmethod
+    def __get_templates(width):
+        """ Gets the row templates of a chart.
+        PARAMETERS:
+        width : width of the chart in characters (at least 25)
+        RETURNS:
+        The blank and highlighted row templates (lists of characters)
+        """
+        midwidth = floor(width / 2)  # middle point of chart
+        blank = [' '] * width  # row templates, copied into the row buffer
+        blank[midwidth] = ':'
+        highlight = ['-'] * width
+        highlight[midwidth] = ':'
+        return blank, highlight
+
+    def __get_row(self, d, plot, width, templates, out):
+        """ Renders one row of a chart.
+        PARAMETERS:
+        d         : date of the row
+        plot      : plot date of the chart, its row is highlighted
+        width     : width of the chart in characters (at least 25)
+        templates : blank and highlighted row templates, see __get_templates
+        out       : row buffer (list of characters), overwritten
+        RETURNS:
+        The row text, without a newline
+        """
+        midwidth = floor(width / 2)  # middle point of chart, distance to edge
+        d = self.__to_zone(d=d)  # labelled with the day that is counted
+        n = self.__get_days(d=d)  # number of days since birth
+        _p, _e, _i, _a = self.__calculate(n=n)  # percentage values
+        p = midwidth + floor(_p * (midwidth - 1))  # middle point to edges
+        e = midwidth + floor(_e * (midwidth - 1))
+        i = midwidth + floor(_i * (midwidth - 1))
+        a = midwidth + floor(_a * (midwidth - 1))
+        blank, highlight = templates
+        out[:] = highlight if n == self.__get_days(d=plot) else blank
+        out[p] = '*' if p in {e, i, a} else 'p'  # '*' for overlapping values
+        out[e] = '*' if e in {i, a, p} else 'e'
+        out[i] = '*' if i in {a, p, e} else 'i'
+        out[a] = '*' if a in {p, e, i} else 'a'
+        return (f'{d:%a %d %b %Y} '  # formatted date
+                f'{"".join(out)} '  # chart output
+                f'{n: >10,}')  # right-justify day width, commas
+
+    def __get_footer(self, plot, width):
+        """ Gets the footer lines of a chart.
+        PARAMETERS:
+        plot  : plot date of the chart
+        width : width of the chart in characters (at least 25)
+        RETURNS:
+        The list of footer lines, empty when the details do not fit
+        """
+        n = self.__get_days(d=plot)  # number of days since birth
+        out = self.__get_detail(n=n)  # percentage details
+        if len(out) > width:  # check for fit
+            return []
+        return [f'{"Outlook Today": >15} '  # right-justify date
+                f'{out: ^{width}} '  # center under chart
+                f'{" ": >10}']  # right-justify day width
+
+    @staticmethod
+    def __decode(data):
+        """ Decodes the JSON data (string) without converting any dates.
+        PARAMETERS:
+        data : JSON data (string) in the 'rows', 'lines', or 'columns' layout
+        RETURNS:
+        The list of data rows, or the dictionary of data columns
+        """
+        try:
+            data = json.loads(data)
+        except json.JSONDecodeError:  # newline-delimited data row objects
+            return [json.loads(line) for line in data.splitlines()
+                    if line.strip()]
+        if isinstance(data, dict) and 'cycles' in data:
+            return [data]  # single line of the lines layout
+        return data
 
     def __repr__(self):
         """ Returns a formal string representation."""
-        return f'{type(self).__name__}(birth={self.birth.__repr__()})'
+        if self.tz is None:
+            return f'{type(self).__name__}(birth={self.birth.__repr__()})'
+        return (f'{type(self).__name__}(birth={self.birth.__repr__()}, '
+                f'tz={self.tz.__repr__()})')
 
     def __str__(self):
         """ Returns an informal string representation."""
-        return self.__get_line(d=datetime.now())
+        return self.__get_line(d=now())
+
+    def alignments(self, start, end, event='peak', tolerance=1, cycles=None):
+        """ Returns the days when all of the cycles share the same event.
+        PARAMETERS:
+        start     : first date to search
+        end       : last date to search
+        event     : name of the shared event, 'critical', 'peak', or 'trough'
+        tolerance : maximum number of days between each cycle and its event
+        cycles    : names of the cycles, default is the active set
+        RETURNS:
+        The numbers of days since birth (array) of the aligned days
+        NOTES:
+        Each cycle only allows a few days within one cycle length (residues),
+        and the combined residues repeat every least common multiple of the
+        cycle lengths (21,252 days for the primary cycles).  The residues are
+        merged with the Chinese remainder theorem, so the cost depends on the
+        number of aligned days found, not on the date range.
+        """
+        low, high = self.__get_days(d=start), self.__get_days(d=end)
+        solutions = [(0, 1)]  # residue and modulus of every aligned day
+        for wave in self.__get_waves(cycles).values():
+            residues = {(n + d) % wave
+                        for n in self.__find_events(event, 0, wave - 1, wave)
+                        for d in range(-tolerance, tolerance + 1)}
+            merged = []
+            for a, m in solutions:
+                g = gcd(m, wave)
+                lcm = m // g * wave
+                inverse = pow(m // g, -1, wave // g) if wave // g > 1 else 0
+                for b in residues:
+                    if (b - a) % g:  # incompatible residues, no common days
+                        continue
+                    k = (b - a) // g * inverse % (wave // g)
+                    merged.append(((a + m * k) % lcm, lcm))
+            solutions = merged
+        days = []
+        for a, m in solutions:  # step through each residue class directly
+            days.extend(range(low + (a - low) % m, high + 1, m))
+        return array('q', sorted(days))
 
     @classmethod
-    def from_ymd(cls, year=datetime.now().year, month=datetime.now().month,
-                 day=datetime.now().day):
+    def cache_clear(cls):
+        """ Invalidates all of the cached charts and data rows."""
+        with Biorhythm.__lock:
+            Biorhythm.__cache.clear()
+            Biorhythm.__hits = Biorhythm.__misses = 0
+
+    @classmethod
+    def cache_info(cls):
+        """ Returns the cache statistics.
+        RETURNS:
+        The number of hits, misses, cached entries, and maximum entries
+        """
+        with Biorhythm.__lock:
+            return {'hits': Biorhythm.__hits, 'misses': Biorhythm.__misses,
+                    'size': len(Biorhythm.__cache), 'maxsize': Biorhythm.cache}
+
+    def critical_days(self, start, end, cycles=None):
+        """ Returns the critical days, when the cycles cross the zero line.
+        PARAMETERS:
+        start  : first date to search
+        end    : last date to search
+        cycles : names of the cycles, including any of the secondary cycles
+                 'spiritual', 'intuition', 'awareness', and 'aesthetic',
+                 default is the active set of the cycle registry
+        RETURNS:
+        The numbers of days since birth (array) for each cycle, keyed by the
+        cycle name; the critical day is the one on which the crossing occurs
+        NOTES:
+        The days are calculated directly from the cycle lengths, so the cost
+        depends on the number of critical days found, not on the date range.
+        Convert to dates with: self.birth + timedelta(days=n)
+        """
+        low, high = self.__get_days(d=start), self.__get_days(d=end)
+        return {cycle: self.__find_events('critical', low, high, wave)
+                for cycle, wave in self.__get_waves(cycles).items()}
+
+    def peaks(self, start, end, cycles=None):
+        """ Returns the peak days, when the cycles reach +100%.
+        PARAMETERS:
+        start  : first date to search
+        end    : last date to search
+        cycles : names of the cycles, default is the active set
+        RETURNS:
+        The numbers of days since birth (array) for each cycle, keyed by the
+        cycle name; the peak day is the one nearest to the exact maximum
+        """
+        low, high = self.__get_days(d=start), self.__get_days(d=end)
+        return {cycle: self.__find_events('peak', low, high, wave)
+                for cycle, wave in self.__get_waves(cycles).items()}
+
+    def troughs(self, start, end, cycles=None):
+        """ Returns the trough days, when the cycles reach -100%.
+        PARAMETERS:
+        start  : first date to search
+        end    : last date to search
+        cycles : names of the cycles, default is the active set
+        RETURNS:
+        The numbers of days since birth (array) for each cycle, keyed by the
+        cycle name; the trough day is the one nearest to the exact minimum
+        """
+        low, high = self.__get_days(d=start), self.__get_days(d=end)
+        return {cycle: self.__find_events('trough', low, high, wave)
+                for cycle, wave in self.__get_waves(cycles).items()}
+
+    @classmethod
+    def from_ymd(cls, year=None, month=None, day=None):
         """ Initializes a chart from the birth year, month, and day.
         PARAMETERS:
         year  : birth year of the person
@@ -196,19 +791,24 @@ class Biorhythm:
         RETURNS:
         An instance of the class
         """
+        current = now()  # one reading of the clock for all of the parts
+        year = current.year if year is None else year
+        month = current.month if month is None else month
+        day = current.day if day is None else day
         return cls(birth=datetime(year, month, day))
 
-    def datarow(self, plot=datetime.now()):
+    def datarow(self, plot=None):
         """ Returns the data row (object) for a plot date.
         PARAMETERS:
         plot : plot date for which to return the data row (object)
         RETURNS:
         The data row (object)
         """
+        plot = self.__to_zone(d=now() if plot is None else plot)
         n = self.__get_days(d=plot)  # number of days since birth
         p, e, i, a = self.__calculate(n=n)  # percentage values
         row = {}  # dictionary object
-        row['birth'] = self.birth  # datetime requires a custom JSON encoder
+        row['birth'] = self.__zoned  # datetime requires a custom JSON encoder
         row['plot'] = plot  # datetime requires a custom JSON encoder
         row['day'] = n
         row['cycles'] = cycles = {}  # nested dictionary object
@@ -218,11 +818,13 @@ class Biorhythm:
         cycles['a'] = a
         return row
 
-    def datarows(self, plot=datetime.now(), days=0):
+    def datarows(self, plot=None, days=0, compact=False):
         """ Returns the data rows (object) for a plot date range.
         PARAMETERS:
-        plot : plot date for which to return the data rows (object)
-        days : number of days to show before and after the plot date
+        plot    : plot date for which to return the data rows (object)
+        days    : number of days to show before and after the plot date
+        compact : if true, return compact data rows backed by value arrays,
+                  converted to the nested shape only when accessed
         RETURNS:
         The data rows (object)
         NOTES:
@@ -231,72 +833,304 @@ class Biorhythm:
         pvalues = [row['cycles']['p'] for row in rows]
         evalues = [row['cycles']['e'] for row in rows]
         ivalues = [row['cycles']['i'] for row in rows]
+        The data rows hold the exact plot time, so the default plot date (the
+        current time) is never cached; pass a plot date to use the cache.
         """
-        rows = []  # list object
+        default = plot is None  # current time, differs on every call
+        plot = now() if plot is None else plot
+        if compact:  # fixed memory per data row, never cached
+            first = self.__to_zone(d=plot) - timedelta(days=days)
+            n = self.__get_days(d=first)  # number of days since birth
+            rows = Datarows(birth=self.__zoned, plot=first, day=n)
+            for n in range(n, n + 2 * days + 1):
+                p, e, i, a = self.__calculate(n=n)  # percentage values
+                rows.p.append(p)
+                rows.e.append(e)
+                rows.i.append(i)
+                rows.a.append(a)
+            return rows
+        if Biorhythm.cache < 1 or default:  # disabled, or never hit
+            return list(self.iter_datarows(plot=plot, days=days))
+        key = self.__cache_key('datarows', plot, days)
+        rows = self.__cache_get(key)
+        if rows is None:
+            rows = tuple(self.iter_datarows(plot=plot, days=days))
+            self.__cache_set(key, rows)
+        # copies protect the cached data rows from changes by the caller
+        return [dict(row, cycles=dict(row['cycles'])) for row in rows]
+
+    def iter_datarows(self, plot=None, days=0):
+        """ Yields the data rows (object) for a plot date range.
+        PARAMETERS:
+        plot : plot date for which to yield the data rows (object)
+        days : number of days to yield before and after the plot date
+        YIELDS:
+        The data row (object) for each date, produced lazily on demand
+        """
+        plot = now() if plot is None else plot
         dates = (plot + timedelta(days=d) for d in range(-days, days + 1))
         for d in dates:  # generator expression above yields dates lazily
-            row = self.datarow(plot=d)
-            rows.append(row)
-        return rows
+            yield self.datarow(plot=d)
 
-    def json(self, plot=datetime.now(), days=0, indent=4):
+    def json(self, plot=None, days=0, indent=4, orient='rows'):
         """ Returns the JSON data (string) for a plot date range.
         PARAMETERS:
         plot   : plot date for which to return the JSON data (string)
         days   : number of days to show before and after the plot date
         indent : number spaces to indent for each JSON level
+        orient : layout of the JSON data (string)
+                 'rows'    : array of data row objects (default)
+                 'lines'   : newline-delimited data row objects (NDJSON)
+                 'columns' : single object of value arrays, birth date once
         RETURNS:
         The serialized JSON data (string)
         Complex data types are converted using a custom default encoder.
         Very small decimal values may be returned using scientific notation.
+        The indent only applies to the 'rows' layout, the other layouts are
+        always compact.
+        The data holds the exact plot time, so the default plot date (the
+        current time) is never cached; pass a plot date to use the cache.
         """
+        if plot is None:  # current time, differs on every call
+            return ''.join(self.iter_json(days=days, indent=indent,
+                                          orient=orient))
+        key = self.__cache_key('json', plot, days, indent, orient)
+        data = self.__cache_get(key)
+        if data is None:
+            data = ''.join(self.iter_json(plot=plot, days=days, indent=indent,
+                                          orient=orient))
+            self.__cache_set(key, data)
+        return data
+
+    def iter_json(self, plot=None, days=0, indent=4, orient='rows'):
+        """ Yields the JSON data (string) for a plot date range in chunks.
+        PARAMETERS:
+        plot   : plot date for which to yield the JSON data (string)
+        days   : number of days to yield before and after the plot date
+        indent : number spaces to indent for each JSON level
+        orient : layout of the JSON data (string), see the json method
+        YIELDS:
+        The serialized JSON data (string), one chunk per data row
+        The joined chunks are identical to the json method output.
+        """
+        plot = now() if plot is None else plot
+
         def default(obj):  # custom encoder inner function
             if isinstance(obj, datetime):
                 return obj.isoformat()  # ISO 8601 string
             raise TypeError('Unknown type not serializable')
-        rows = self.datarows(plot=plot, days=days)
-        return json.dumps(rows, indent=indent, default=default)
+        if orient == 'lines':  # one compact data row per line
+            for row in self.iter_datarows(plot=plot, days=days):
+                yield json.dumps(row, default=default) + '\n'
+            return
+        if orient == 'columns':  # one compact object, no repeated keys
+            columns = {'birth': self.__zoned, 'plot': [], 'day': [],
+                       'p': [], 'e': [], 'i': [], 'a': []}
+            for row in self.iter_datarows(plot=plot, days=days):
+                columns['plot'].append(row['plot'])
+                columns['day'].append(row['day'])
+                for key, value in row['cycles'].items():
+                    columns[key].append(value)
+            yield json.dumps(columns, default=default)
+            return
+        if orient != 'rows':
+            raise ValueError(f'Unknown JSON orient: {orient}')
+        if indent is None:  # compact array, single line
+            prefix, separator, end = '', ', ', ']'
+        else:  # indented array, one level deeper than the outer brackets
+            prefix = ' ' * indent if isinstance(indent, int) else indent
+            separator, end = ',', '\n]'
+        first = True
+        for row in self.iter_datarows(plot=plot, days=days):
+            out = json.dumps(row, indent=indent, default=default)
+            if indent is not None:  # nest each row line inside the array
+                out = '\n' + '\n'.join(prefix + line
+                                       for line in out.split('\n'))
+            yield ('[' if first else separator) + out
+            first = False
+        yield '[]' if first else end
 
-    def load(self, data):
+    def dump(self, fp, plot=None, days=0, indent=4, orient='rows'):
+        """ Writes the JSON data (string) for a plot date range to a file.
+        PARAMETERS:
+        fp     : object with a write method, such as the console or a file
+        plot   : plot date for which to write the JSON data (string)
+        days   : number of days to write before and after the plot date
+        indent : number spaces to indent for each JSON level
+        orient : layout of the JSON data (string), see the json method
+        NOTES:
+        The 'rows' and 'lines' data rows are written as they are produced,
+        so memory use does not grow with the number of days requested.
+        """
+        plot = now() if plot is None else plot
+        for chunk in self.iter_json(plot=plot, days=days, indent=indent,
+                                    orient=orient):
+            fp.write(chunk)
+
+    def load(self, data, dates='datetime'):
         """ Returns the data rows (object) from the JSON data (string).
         PARAMETERS:
-        data : JSON data (string)
+        data  : JSON data (string)
+        dates : conversion of the birth and plot dates
+                'datetime' : converted to datetime objects (default)
+                'string'   : left as ISO 8601 strings, converted lazily
         RETURNS:
         The data rows (object) from the deserialized JSON data (string)
-        Complex data types are converted using a custom object hook.
         Very small decimal values may be returned using scientific notation.
+        Any of the 'rows', 'lines', or 'columns' layouts can be decoded.
+        NOTES:
+        The known data row keys are converted in bulk after the JSON data
+        (string) is parsed, instead of inspecting every decoded object.  Only
+        the objects with a 'birth' or 'plot' key are converted; any other
+        JSON data is returned as decoded.
+        """
+        if dates not in {'datetime', 'string'}:
+            raise ValueError(f'Unknown dates conversion: {dates}')
+        data = self.__decode(data=data)
+        columns = ('birth', 'plot', 'day', 'p', 'e', 'i', 'a')
+        if isinstance(data, dict) and all(key in data for key in columns) \
+                and isinstance(data['plot'], list):  # columns layout
+            birth, plots = data['birth'], data['plot']
+            if dates == 'datetime':
+                birth = self.__convert(value=birth)
+                plots = [self.__convert(value=plot) for plot in plots]
+            return [{'birth': birth, 'plot': plot, 'day': day,
+                     'cycles': {'p': p, 'e': e, 'i': i, 'a': a}}
+                    for plot, day, p, e, i, a in zip(plots, data['day'],
+                                                     data['p'], data['e'],
+                                                     data['i'], data['a'])]
+        if dates == 'datetime':
+            births = {}  # each distinct birth date is only converted once
+            for row in data if isinstance(data, list) else [data]:
+                if not isinstance(row, dict):  # not a data row
+                    continue
+                if 'birth' in row:
+                    row['birth'] = self.__convert(value=row['birth'],
+                                                  dates=births)
+                if 'plot' in row:
+                    row['plot'] = self.__convert(value=row['plot'])
+        return data
+
+    @staticmethod
+    def __convert(value, dates=None):
+        """ Converts an ISO 8601 date string, leaving any other value as is.
+        PARAMETERS:
+        value : decoded JSON value
+        dates : dates already converted, keyed by their strings, or None
+        RETURNS:
+        The date (datetime), or the value when it is not a date string
+        """
+        if not isinstance(value, str):
+            return value
+        if dates is not None and value in dates:
+            return dates[value]
+        try:
+            d = datetime.fromisoformat(value)
+        except ValueError:  # any other string
+            return value
+        if dates is not None:
+            dates[value] = d
+        return d
+
+    def load_columns(self, data, dates='datetime'):
+        """ Returns the data columns (object) from the JSON data (string).
+        PARAMETERS:
+        data  : JSON data (string)
+        dates : conversion of the birth and plot dates
+                'datetime' : converted to datetime objects (default)
+                'string'   : left as ISO 8601 strings, converted lazily
+                'numpy'    : converted to NumPy datetime64 values, with the
+                             day and cycle values as NumPy arrays
+        RETURNS:
+        The data columns (object) keyed by 'birth', 'plot', 'day', 'p', 'e',
+        'i', and 'a', with the birth date stored only once
+        Any of the 'rows', 'lines', or 'columns' layouts can be decoded.
+        """
+        if dates not in {'datetime', 'string', 'numpy'}:
+            raise ValueError(f'Unknown dates conversion: {dates}')
+        data = self.__decode(data=data)
+        if isinstance(data, list):  # rows or lines layout, pivot into columns
+            columns = {'birth': data[0]['birth'] if data else None,
+                       'plot': [row['plot'] for row in data],
+                       'day': [row['day'] for row in data]}
+            for key in ('p', 'e', 'i', 'a'):
+                columns[key] = [row['cycles'][key] for row in data]
+            data = columns
+        if dates == 'datetime':
+            if data['birth'] is not None:
+                data['birth'] = datetime.fromisoformat(data['birth'])
+            data['plot'] = [datetime.fromisoformat(d) for d in data['plot']]
+        elif dates == 'numpy':
+            import numpy as np  # optional, only required for this conversion
+            if data['birth'] is not None:
+                data['birth'] = np.datetime64(data['birth'])
+            data['plot'] = np.array(data['plot'], dtype='datetime64[s]')
+            data['day'] = np.array(data['day'], dtype=np.int64)
+            for key in ('p', 'e', 'i', 'a'):
+                data[key] = np.array(data[key], dtype=np.float64)
+        return data
+
+    def render(self, plot=None, width=45, days=14):
+        """ Returns a chart (string).
+        PARAMETERS:
+        plot  : plot date of the chart
+        width : width of the chart in characters
+        days  : number of days to show before and after the plot date
+        RETURNS:
+        The chart text, exactly as printed to the console
         """
-        def object_hook(dct):  # custom decoder inner function
-            for key in {'birth', 'plot'}:
-                if key in dct:
-                    try:
-                        dct[key] = datetime.fromisoformat(dct[key])
-                    except:
-                        pass
-            return dct
-        return json.loads(data, object_hook=object_hook)
-
-    def print(self, plot=datetime.now(), width=45, days=14):
+        plot = now() if plot is None else plot
+        return self.__render(plot=plot, width=width, days=days, detail=True)
+
+    def print(self, plot=None, width=45, days=14):
         """ Prints a chart to the console.
         PARAMETERS:
         plot  : plot date of the chart
         width : width of the chart in characters
         days  : number of days to show before and after the plot date
         """
+        plot = now() if plot is None else plot
         self.__plot(plot=plot, width=width, days=days, detail=True,
                     file=sys.stdout, flush=Biorhythm.flush)
 
-    def write(self, plot=datetime.now(), width=45, days=14, echo=False):
-        """ Writes a chart to a file.
+    def window(self, plot=None, width=45, days=14):
+        """ Returns a chart window that can slide along the dates.
         PARAMETERS:
         plot  : plot date of the chart
         width : width of the chart in characters
         days  : number of days to show before and after the plot date
-        echo  : if true, echo the file content to the console
+        RETURNS:
+        The chart window, see the Window class
+        """
+        plot = now() if plot is None else plot
+        width = 25 if width < 25 else width  # minimum width of chart
+        templates = self.__get_templates(width=width)
+        out = templates[0][:]  # row buffer, reused for every row
+
+        def row(d, plot):  # inner function, binds the chart layout
+            return self.__get_row(d=d, plot=plot, width=width,
+                                  templates=templates, out=out)
+
+        def footer(plot):  # inner function, binds the chart layout
+            return self.__get_footer(plot=plot, width=width)
+        return Window(header=self.__get_header(width=width), row=row,
+                      footer=footer, plot=plot, days=days)
+
+    def write(self, plot=None, width=45, days=14, echo=False,
+              directory=''):
+        """ Writes a chart to a file.
+        PARAMETERS:
+        plot      : plot date of the chart
+        width     : width of the chart in characters
+        days      : number of days to show before and after the plot date
+        echo      : if true, echo the file content to the console
+        directory : output directory of the file, default is the current one
         RETURNS:
         The file name of the chart
         """
-        filename = f'{self.birth:mybio.%Y.%m.%d.txt}'
+        plot = now() if plot is None else plot
+        filename = os.path.join(directory,
+                                f'{self.__zoned:mybio.%Y.%m.%d.txt}')
         with open(filename, 'w', encoding=Biorhythm.encoding) as file:
             self.__plot(plot=plot, width=width, days=days, detail=True,
                         file=file, flush=Biorhythm.flush)
@@ -307,22 +1141,74 @@ class Biorhythm:
         print('BIORHYTHM saved to file:', filename)
         return filename
 
-    def write_year(self, year=datetime.now().year, width=45):
+    def write_month(self, plot=None, width=45, directory=''):
+        """ Writes a monthly chart to a file.
+        PARAMETERS:
+        plot      : plot date of the chart, usually the middle of the month
+        width     : width of the chart in characters
+        directory : output directory of the file, default is the current one
+        RETURNS:
+        The file name of the chart
+        """
+        plot = now() if plot is None else plot
+        filename = os.path.join(directory, f'{plot:%Y.%m.mybio.txt}')
+        out = (f'{plot:%B %Y} ').upper()  # extra header
+        out += self.__render(plot=plot, width=width, days=21, detail=False)
+        with open(filename, 'w', encoding=Biorhythm.encoding) as file:
+            file.write(out)  # single write per chart
+        return filename
+
+    def write_year(self, year=None, width=45, directory=''):
         """ Writes an entire year of charts to monthly files.
         PARAMETERS:
-        year  : plot year for the charts
-        width : width of the charts in characters
+        year      : plot year for the charts
+        width     : width of the charts in characters
+        directory : output directory of the files, default is the current one
         """
+        year = now().year if year is None else year
         for month in range(1, 13):  # for months 1 to 12
             plot = datetime(year, month, 15)  # middle day of month
-            filename = f'{plot:%Y.%m.mybio.txt}'
-            with open(filename, 'w', encoding=Biorhythm.encoding) as file:
-                print((f'{plot:%B %Y} ').upper(), end='',  # extra header
-                      file=file, flush=Biorhythm.flush)
-                self.__plot(plot=plot, width=width, days=21, detail=False,
-                            file=file, flush=Biorhythm.flush)
+            filename = self.write_month(plot=plot, width=width,
+                                        directory=directory)
             print('Saved:', filename)
 
+    @classmethod
+    def write_years(cls, births, years, width=45, directory='', workers=None,
+                    processes=True):
+        """ Writes entire years of charts for many people concurrently.
+        PARAMETERS:
+        births    : birth dates of the people
+        years     : plot years for the charts
+        width     : width of the charts in characters
+        directory : output directory of the files, default is the current one
+        workers   : maximum number of workers, default is the processor count
+        processes : if true, use a process pool, otherwise a thread pool
+        RETURNS:
+        The file names of the charts, ordered by birth date, year, and month
+        NOTES:
+        The monthly files for each person are saved to a subdirectory named
+        by the birth date (YYYY.MM.DD), so the file names are deterministic
+        and never collide.  Class attributes and registry cycles changed at
+        runtime are only seen by worker processes started with the 'fork'
+        method.
+        """
+        from concurrent.futures import (  # only required for this method
+            ProcessPoolExecutor, ThreadPoolExecutor)
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with pool(max_workers=workers) as executor:
+            futures = []  # submitted in order, collected in the same order
+            for birth in births:
+                bio = cls(birth=birth)
+                folder = os.path.join(directory, f'{birth:%Y.%m.%d}')
+                os.makedirs(folder, exist_ok=True)
+                for year in years:
+                    for month in range(1, 13):  # for months 1 to 12
+                        plot = datetime(year, month, 15)  # middle of month
+                        futures.append(executor.submit(bio.write_month,
+                                                       plot=plot, width=width,
+                                                       directory=folder))
+            return [future.result() for future in futures]
+
 
 if __name__ == '__main__':  # module can be imported or started interactively
     print('BIORHYTHM:')
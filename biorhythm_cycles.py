@@ -0,0 +1,480 @@
+﻿#!/usr/bin/env python3
+""" A Python module for sharing the biorhythm cycle definitions.
+
+Defines one registry of cycles (name, symbol, period, enabled) for all of the
+chart modules, along with the precomputed sine values for each period.  The
+primary cycles of physical, emotional, and intellectual are enabled by
+default; the secondary cycles of spiritual, intuition, awareness, and
+aesthetic are registered but disabled.
+
+The text charts of bio, bio_detail, bio_horizonal, biorhythm, and
+biorhythm_mini plot the active set with its symbols, and biorhythm_plot
+selects its cycles by name.  The Biorhythm class always charts the three
+primary cycles (its data rows hold p, e, i, and a), using the registry
+periods unless its own wavelength attributes are set.
+
+https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
+
+MIT License
+
+Copyright (c) 2026 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+FOR ENTERTAINMENT PURPOSES ONLY.
+
+Create a custom script to use the seven-cycle set or to add a new cycle.
+
+#!/usr/bin/env python3
+from datetime import date
+import biorhythm_cycles as bc
+import bio
+bc.enable('spiritual', 'intuition', 'awareness', 'aesthetic')
+bc.register('passion', 'x', 36, enabled=True)  # custom cycle
+for cycle in bc.get_cycles(enabled=True):
+    print(cycle.name, cycle.period)
+print(bc.calculate(n=20003))  # one value per enabled cycle
+bio.get_bio(birth=date(1809, 2, 12), plot=date(1863, 7, 2))  # all eight
+
+Create a custom script to share one phase table, persisted between runs.
+
+#!/usr/bin/env python3
+import biorhythm_cycles as bc
+bc.use_phases(filename='phases.bin')  # memory-mapped after the first run
+print(bc.lookup(n=20003))  # physical, emotional, intellectual, average
+
+Create a custom script to chart a fixed day, such as for repeatable tests.
+
+#!/usr/bin/env python3
+from datetime import datetime
+import biorhythm_cycles as bc
+import biorhythm_mini
+bc.set_clock(lambda: datetime(1863, 7, 2))  # every default date is this day
+biorhythm_mini.get_bio(birth=datetime(1809, 2, 12))
+bc.set_clock()  # back to the system clock
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+from array import array
+from datetime import datetime
+from math import lcm, pi, sin
+import mmap
+import os
+
+
+class Cycle:
+    """ A class for defining a biorhythm cycle.
+    ATTRIBUTES:
+    name    : name of the cycle, such as 'physical'
+    symbol  : single character for the cycle in the text charts
+    period  : number of days for the cycle
+    enabled : if true, the cycle belongs to the active set
+    """
+
+    def __init__(self, name, symbol, period, enabled=False):
+        """ Initializes a cycle.
+        PARAMETERS:
+        name    : name of the cycle, such as 'physical'
+        symbol  : single character for the cycle in the text charts
+        period  : number of days for the cycle
+        enabled : if true, the cycle belongs to the active set
+        """
+        self.name = name
+        self.symbol = symbol
+        self.period = period
+        self.enabled = enabled
+
+    def __repr__(self):
+        """ Returns a formal string representation."""
+        return (f'{type(self).__name__}(name={self.name!r}, '
+                f'symbol={self.symbol!r}, period={self.period!r}, '
+                f'enabled={self.enabled!r})')
+
+
+_cycles = {}  # registered cycles, keyed by name, in registration order
+_tables = {}  # precomputed sine values, keyed by period
+_phases = {}  # precomputed phase tables, keyed by the tuple of periods
+_rows = {}  # phase table rows (tuples), keyed by the tuple of periods
+_bound = [None, None]  # periods and phase table rows of the last lookup
+_options = {'phases': False, 'filename': None,  # see use_phases
+            'clock': datetime.now,  # see set_clock
+            'revision': 0}  # see get_revision
+_limit = 1000000  # maximum number of phase states in one phase table
+
+
+def register(name, symbol, period, enabled=False):
+    """ Registers a cycle, replacing any cycle with the same name.
+    PARAMETERS:
+    name    : name of the cycle, such as 'physical'
+    symbol  : single character for the cycle in the text charts
+    period  : number of days for the cycle
+    enabled : if true, the cycle belongs to the active set
+    RETURNS:
+    The registered cycle
+    """
+    if period < 1:
+        raise ValueError(f'Invalid cycle period: {period}')
+    _cycles[name] = cycle = Cycle(name=name, symbol=symbol, period=period,
+                                  enabled=enabled)
+    _options['revision'] += 1
+    return cycle
+
+
+def enable(*names, enabled=True):
+    """ Adds the named cycles to, or removes them from, the active set.
+    PARAMETERS:
+    names   : names of the cycles
+    enabled : if true, enable the cycles, otherwise disable them
+    """
+    for name in names:
+        get_cycle(name).enabled = enabled
+    _options['revision'] += 1
+
+
+def get_revision():
+    """ Gets the revision of the cycle registry and its options.
+    RETURNS:
+    A number increased by every register, enable, and use_phases call, so
+    the values bound to the registry only need to be rebound when it changes
+    """
+    return _options['revision']
+
+
+def get_cycle(name):
+    """ Gets a registered cycle.
+    PARAMETERS:
+    name : name of the cycle
+    RETURNS:
+    The registered cycle
+    """
+    try:
+        return _cycles[name]
+    except KeyError:
+        raise ValueError(f'Unknown cycle: {name}') from None
+
+
+def get_cycles(enabled=None):
+    """ Gets the registered cycles, in registration order.
+    PARAMETERS:
+    enabled : if true, only the active set; if false, only the inactive
+              cycles; if None, all of the cycles
+    RETURNS:
+    The list of cycles
+    """
+    return [cycle for cycle in _cycles.values()
+            if enabled is None or cycle.enabled == enabled]
+
+
+def get_period(name):
+    """ Gets the number of days for a registered cycle.
+    PARAMETERS:
+    name : name of the cycle
+    RETURNS:
+    The number of days for the cycle
+    """
+    return get_cycle(name).period
+
+
+def get_periods(enabled=True):
+    """ Gets the number of days for each of the registered cycles.
+    PARAMETERS:
+    enabled : if true, only the active set; if None, all of the cycles
+    RETURNS:
+    The tuple of periods, in registration order
+    """
+    return tuple(cycle.period for cycle in get_cycles(enabled=enabled))
+
+
+def get_symbols(enabled=True):
+    """ Gets the chart symbols of the registered cycles.
+    PARAMETERS:
+    enabled : if true, only the active set; if None, all of the cycles
+    RETURNS:
+    The tuple of symbols, in registration order, matching get_periods
+    """
+    return tuple(cycle.symbol for cycle in get_cycles(enabled=enabled))
+
+
+def get_legend(enabled=True):
+    """ Gets the legend of the chart symbols.
+    PARAMETERS:
+    enabled : if true, only the active set; if None, all of the cycles
+    RETURNS:
+    The legend, such as 'p=physical, e=emotional, i=intellectual'
+    """
+    return ', '.join(f'{cycle.symbol}={cycle.name}'
+                     for cycle in get_cycles(enabled=enabled))
+
+
+def mark(out, indices, symbols):
+    """ Marks the cycle symbols on one line of a text chart.
+    PARAMETERS:
+    out     : characters of the chart line (list), changed in place
+    indices : index of each cycle on the line
+    symbols : symbol of each cycle, '*' is marked where cycles overlap
+    """
+    for index, symbol in zip(indices, symbols):
+        out[index] = '*' if indices.count(index) > 1 else symbol
+
+
+def get_table(period):
+    """ Gets the precomputed sine values for one full cycle.
+    PARAMETERS:
+    period : number of days for the cycle
+    RETURNS:
+    The sine values indexed by the number of days into the cycle
+    NOTES:
+    The values at the zero crossings are stored as exactly zero.  There the
+    published formula leaves only a rounding error, which decides the side
+    of the centre line the cycle is charted on, so those days are calculated
+    by the formula instead.
+    """
+    table = _tables.get(period)
+    if table is None:  # built once, shared by every module and chart
+        table = tuple(sin(2 * pi * n / period) if 2 * n % period else 0.0
+                      for n in range(period))  # zero crossings, see notes
+        _tables[period] = table
+    return table
+
+
+def calculate(n, periods=None):
+    """ Calculates the published formula values.
+    PARAMETERS:
+    n       : number of days since birth
+    periods : numbers of days for the cycles, default is the active set
+    RETURNS:
+    The values between -1 and +1, one for each period
+    NOTES:
+    The cycles repeat, so only the day within each cycle is looked up.
+    """
+    if periods is None:
+        periods = get_periods()
+    if _options['phases']:
+        return lookup(n, periods)[:-1]
+    return _get_values(n, periods)
+
+
+def lookup(n, periods=None):
+    """ Looks up the published formula values and their average.
+    PARAMETERS:
+    n       : number of days since birth
+    periods : numbers of days for the cycles, default is the active set
+    RETURNS:
+    The values between -1 and +1, one for each period, followed by the
+    average of the values
+    NOTES:
+    When the phase table is in use (see use_phases), the lookup is a single
+    modulo and index into the rows of the shared phase table.
+    """
+    if periods is None:
+        periods = get_periods()
+    if _options['phases']:
+        if periods != _bound[0]:  # bound once per set of periods
+            _bound[:] = tuple(periods), get_phase_rows(periods)
+        rows = _bound[1]
+        if rows is not None:
+            row = rows[n % len(rows)]
+            if row is not None:  # zero crossings are calculated instead
+                return row
+    values = _get_values(n, periods)
+    return (*values, sum(values) / len(values))
+
+
+def _get_values(n, periods):
+    """ Gets the published formula values from the sine tables.
+    PARAMETERS:
+    n       : number of days since birth
+    periods : numbers of days for the cycles
+    RETURNS:
+    The values between -1 and +1, one for each period
+    NOTES:
+    Only the zero crossings (see get_table) are calculated by the formula.
+    """
+    return tuple(get_table(period)[n % period] or sin(2 * pi * n / period)
+                 for period in periods)
+
+
+def use_phases(enabled=True, filename=None):
+    """ Uses the shared phase table for all of the calculations.
+    PARAMETERS:
+    enabled  : if true, use the phase table, otherwise the sine values
+    filename : name of a file to persist the phase table of the active set,
+               memory-mapped when it already exists, or None
+    NOTES:
+    All of the cycles repeat together every least common multiple of their
+    periods (21,252 days for the primary cycles), so every number of days
+    since birth maps to one of those phase states.  The phase table holds
+    the values and their average for every state; it is built lazily, once
+    per process, the first time it is needed.
+    """
+    _options['phases'] = enabled
+    _options['filename'] = filename
+    _phases.clear()  # rebuilt or remapped on the next lookup
+    _rows.clear()
+    _bound[:] = None, None
+    _options['revision'] += 1
+
+
+def phases_enabled():
+    """ Gets whether the shared phase table is in use.
+    RETURNS:
+    True when the calculations use the phase table, see use_phases
+    """
+    return _options['phases']
+
+
+def get_phases(periods=None):
+    """ Gets the phase table for a set of cycles.
+    PARAMETERS:
+    periods : numbers of days for the cycles, default is the active set
+    RETURNS:
+    The flat table of values, one header row of the periods followed by one
+    row of the values and their average for every phase state, or None when
+    there are more phase states than the limit
+    """
+    if periods is None:
+        periods = get_periods()
+    periods = tuple(periods)
+    if periods in _phases:
+        return _phases[periods]
+    states = lcm(*periods)
+    if states > _limit:  # too large, the sine values are used instead
+        _phases[periods] = None
+        return None
+    header = array('d', periods)
+    header.append(0.0)  # header row, identifies the periods of the file
+    width = len(header)
+    filename = _options['filename'] if periods == get_periods() else None
+    table = None
+    if filename and os.path.isfile(filename) \
+            and os.path.getsize(filename) == (states + 1) * width * 8:
+        with open(filename, 'rb') as file:  # mapping outlives the file
+            table = memoryview(mmap.mmap(file.fileno(), 0,
+                                         access=mmap.ACCESS_READ)).cast('d')
+        if table[:width].tolist() != header.tolist():  # other periods
+            table = None
+    if table is None:
+        table = array('d', header)
+        for n in range(states):
+            values = [get_table(period)[n % period] for period in periods]
+            table.extend(values)
+            table.append(sum(values) / len(values))
+        if filename:
+            with open(filename, 'wb') as file:
+                table.tofile(file)
+    _phases[periods] = table
+    return table
+
+
+def get_phase_rows(periods=None):
+    """ Gets the rows of the phase table for a set of cycles.
+    PARAMETERS:
+    periods : numbers of days for the cycles, default is the active set
+    RETURNS:
+    The tuple of rows, indexed by the phase state, each row holding the
+    values and their average (tuple), or None when there are more phase
+    states than the limit
+    NOTES:
+    The rows are built once from the phase table (see get_phases), so a
+    lookup only takes a modulo and an index.  The rows of the zero crossings
+    (see get_table) are None, those days are calculated by the formula.
+    """
+    if periods is None:
+        periods = get_periods()
+    periods = tuple(periods)
+    if periods in _rows:
+        return _rows[periods]
+    table = get_phases(periods)
+    rows = None
+    if table is not None:
+        width = len(periods) + 1
+        values = table[width:].tolist()  # after the header row
+        rows = tuple(row if 0.0 not in row[:-1] else None
+                     for row in (tuple(values[start:start + width])
+                                 for start in range(0, len(values), width)))
+    _rows[periods] = rows
+    return rows
+
+
+# Define the primary and secondary cycles (days per cycle)
+# https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
+register('physical', 'p', 23, enabled=True)
+register('emotional', 'e', 28, enabled=True)
+register('intellectual', 'i', 33, enabled=True)
+register('spiritual', 's', 53)
+register('intuition', 'n', 38)
+register('awareness', 'w', 48)
+register('aesthetic', 't', 43)
+
+
+def set_clock(clock=None):
+    """ Sets the clock for the current date and time of all of the charts.
+    PARAMETERS:
+    clock : function returning the current date and time (datetime), or None
+            for the system clock
+    NOTES:
+    The default dates of the chart modules are read from the clock on every
+    call, not once when the modules are imported, so long-running processes
+    always chart the current day.
+    """
+    _options['clock'] = datetime.now if clock is None else clock
+
+
+def now():
+    """ Gets the current date and time.
+    RETURNS:
+    The current date and time (datetime) from the clock, see set_clock
+    """
+    return _options['clock']()
+
+
+def today():
+    """ Gets the current date.
+    RETURNS:
+    The current date (date) from the clock, see set_clock
+    """
+    return now().date()
+
+
+def to_zone(d, tz=None):
+    """ Converts a date to a time zone.
+    PARAMETERS:
+    d  : date or datetime
+    tz : time zone (tzinfo), or None to keep the date's own
+    RETURNS:
+    The date converted to the time zone when it is aware, otherwise the date
+    as is (naive datetime and date objects have no time zone to convert)
+    """
+    if tz is not None and getattr(d, 'tzinfo', None) is not None:
+        return d.astimezone(tz)
+    return d
+
+
+def get_ordinal(d, tz=None):
+    """ Gets the day number (proleptic Gregorian ordinal) of a date.
+    PARAMETERS:
+    d  : date or datetime, converted to the time zone first (see to_zone)
+    tz : time zone (tzinfo), or None to keep the date's own
+    RETURNS:
+    The day number, 1 for January 1 of year 1, so any times of the day are
+    ignored when counting calendar days
+    """
+    return to_zone(d, tz).toordinal()
@@ -101,12 +101,16 @@ https://www.cancer.org/
 """
 
 from datetime import datetime as dt, timedelta as td
-from math import floor, pi, sin
+from math import floor
 import sys
 
+from biorhythm_cycles import (get_legend, get_ordinal, get_periods,
+                              get_symbols, lookup, mark, now, to_zone)
 
-def get_bio(birth=dt.now(), plot=dt.now(), width=45, days=7,
-            header=True, verbose=True, file=sys.stdout, flush=False):
+
+def get_bio(birth=None, plot=None, width=45, days=7,
+            header=True, verbose=True, file=sys.stdout, flush=False,
+            tz=None):
     """ Plots a chart of physical, emotional, and intellectual cycles.
     PARAMETERS:
     birth   : birth date of the person
@@ -117,43 +121,46 @@ def get_bio(birth=dt.now(), plot=dt.now(), width=45, days=7,
     verbose : if true, include the daily percentages with the chart output
     file:   : object with a write method, such as the console or a file
     flush:  : if true, commit the file output immediately without buffering
+    tz      : time zone in which to count the days, aware dates are converted
+              to it first, default is each date's own
+    NOTES:
+    The cycles are the active set of the shared cycle registry.
     """
-    pwave, ewave, iwave = 23, 28, 33  # physical, emotional, intellectual
+    birth = now() if birth is None else birth
+    plot = now() if plot is None else plot
+    birth = to_zone(birth, tz=tz)  # only aware dates are converted
+    plot = to_zone(plot, tz=tz)
+    birthday = get_ordinal(birth)  # calendar day numbers, times are ignored
+    plotday = get_ordinal(plot)
+    waves = get_periods()  # active set of the shared cycle registry
+    symbols = (*get_symbols(), 'a')  # and the average
     width = 15 if width < 15 else width  # minimum width of chart
     midwidth = floor(width / 2)  # middle point of chart, distance to edge
     if header:
         print('BIORHYTHM for Birth Date:', birth.strftime('%A, %d %B %Y'),
               file=file, flush=flush)
-        print('p=physical, e=emotional, i=intellectual, a=average for days',
-              'since birth',
+        print(get_legend() + ', a=average for days', 'since birth',
               file=file, flush=flush)
         print('-100%', '=' * (width - 12), '+100%',  # 12 for literals/spaces
               file=file, flush=flush)
     dates = (plot + td(days=d) for d in range(-days, days + 1))
     for d in dates:  # generator expression above yields dates lazily on use
-        n = (d - birth).days  # number of days since birth
+        n = d.toordinal() - birthday  # number of days since birth
         # sine models -/+ percentages of distance from middle point of chart
-        _p = sin(2 * pi * n / pwave)  # published formula calculations
-        _e = sin(2 * pi * n / ewave)
-        _i = sin(2 * pi * n / iwave)
-        _a = (_p + _e + _i) / 3
-        p = midwidth + floor(_p * (midwidth - 1))  # middle point to edges
-        e = midwidth + floor(_e * (midwidth - 1))
-        i = midwidth + floor(_i * (midwidth - 1))
-        a = midwidth + floor(_a * (midwidth - 1))
-        out = list(('-' if d.date() == plot.date() else ' ') * width)
+        values = lookup(n, waves)  # published formula, then the average
+        indices = [midwidth + floor(v * (midwidth - 1))  # middle to edges
+                   for v in values]
+        out = list(('-' if n == plotday - birthday else ' ') * width)
         out[midwidth] = ':'
-        out[p] = '*' if p in {e, i, a} else 'p'  # '*' for overlapping values
-        out[e] = '*' if e in {i, a, p} else 'e'
-        out[i] = '*' if i in {a, p, e} else 'i'
-        out[a] = '*' if a in {p, e, i} else 'a'
+        mark(out, indices, symbols)  # '*' for overlapping values
         print(''.join(out), d.strftime('%a %d %b %Y,'), 'Day={:,}'.format(n),
               file=file, flush=flush)
         if verbose:  # verbose outputs formatted percentages
-            print(' ' * width,
-                  f'  p:{_p*100:+.1f}% e:{_e*100:+.1f}% i:{_i*100:+.1f}%',
+            percents = (f'{s}:{v*100:+.1f}%'
+                        for s, v in zip(symbols, values[:-1]))
+            print(' ' * width, '  ' + ' '.join(percents),
                   file=file, flush=flush)
-            print(' ' * width, f'  average:{_a*100:+.1f}%',
+            print(' ' * width, f'  average:{values[-1]*100:+.1f}%',
                   file=file, flush=flush)
 
 
@@ -58,6 +58,55 @@ bp.main(year=1908, month=9, day=15, block=False,
         spiritual=True, intuition=True, awareness=True, aesthetic=True)
 input('Press ENTER to Continue: ')
 
+Calculate the values without a chart (Matplotlib is never imported).
+
+#!/usr/bin/env python3
+import biorhythm_cycles as bc
+import biorhythm_plot as bp
+import numpy as np
+bc.enable('spiritual', 'intuition', 'awareness', 'aesthetic')  # all seven
+dates, counts, values = bp.get_values(birthdate=np.datetime64('1908-09-15'))
+physical, emotional, intellectual = values[:3]  # one row per cycle
+
+Calculate the values for many people and dates at once, without a chart.
+
+#!/usr/bin/env python3
+import biorhythm_plot as bp
+import numpy as np
+births = np.array(['1908-09-15', '1809-02-12'], dtype='datetime64[D]')
+plots = np.arange('2025-01-01', '2026-01-01', dtype='datetime64[D]')
+p, e, i, a = bp.get_batch(births, plots)  # each shaped (2, 365)
+
+Compare the cycles of every pair of people in a team, without a chart.
+
+#!/usr/bin/env python3
+import biorhythm_plot as bp
+import numpy as np
+births = np.array(['1908-09-15', '1809-02-12', '1869-10-02'],
+                  dtype='datetime64[D]')
+(first, second), offsets, scores = bp.get_compatibility(births)
+for a, b, score in zip(first, second, scores):
+    print(births[a], births[b], np.round(score * 100))  # percent per cycle
+
+Save chart images for many people at once, without a display.
+
+#!/usr/bin/env python3
+import biorhythm_plot as bp
+import numpy as np
+births = np.array(['1908-09-15', '1809-02-12'], dtype='datetime64[D]')
+bp.get_images(births, filenames=['singleton.png', 'lincoln.png'])
+
+Precompute a lifetime series to a binary file and read back a date range.
+
+#!/usr/bin/env python3
+import biorhythm_plot as bp
+import numpy as np
+bp.write_series('singleton.bio', np.datetime64('1908-09-15'),
+                np.datetime64('1908-09-15'), days=36500)
+series = bp.Series('singleton.bio')  # memory-mapped, nothing is parsed
+dates, values = series.get_slice(np.datetime64('2003-11-01'),
+                                 np.datetime64('2003-11-30'))
+
 If you enjoy this software, please do something kind for free.
 
 Please consider giving to cancer research.
@@ -65,16 +114,19 @@ https://braintumor.org/
 https://www.cancer.org/
 """
 
-from datetime import datetime
+import io
 import math
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import matplotlib.ticker as mticker
+import struct
 import numpy as np
 
+from biorhythm_cycles import get_cycles, get_period, get_periods, now, today
+
+# Matplotlib is only imported when a chart is drawn, so the calculations can
+# be used without its import time or any display backend probing
 
-def get_bio(birthdate=np.datetime64('today'),
-            plotdate=np.datetime64('today'),
+
+def get_bio(birthdate=None,
+            plotdate=None,
             physical=False, emotional=False,
             intellectual=False, spiritual=False,
             intuition=False, awareness=False,
@@ -94,38 +146,114 @@ def get_bio(birthdate=np.datetime64('today'),
     days         : the number of days to plot
     block        : block the process while the chart window is open
     """
+    birthdate = np.datetime64(today()) if birthdate is None else birthdate
+    plotdate = np.datetime64(today()) if plotdate is None else plotdate
+    import matplotlib.pyplot as plt
 
     # Define the output date and number formats
     longdate = '%A, %B %d, %Y'  # Wednesday, January 31, 1900
-    shortdate = '%a %b %d'      # Wed Jan 31
     number = '{:,}'             # 9,999
 
-    # Define the primary wavelengths (days per cycle)
+    # Select the cycles from the shared cycle registry
     # https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
-    pwave = 23  # physical
-    ewave = 28  # emotional
-    iwave = 33  # intellectual
-
-    # Define the secondary wavelengths (days per cycle)
-    sp2wave = 53  # spiritual
-    in2wave = 38  # intuition
-    aw2wave = 48  # awareness
-    ae2wave = 43  # aesthetic
+    cycles = select_cycles(physical=physical, emotional=emotional,
+                           intellectual=intellectual, spiritual=spiritual,
+                           intuition=intuition, awareness=awareness,
+                           aesthetic=aesthetic)
 
-    # Sanity check (minimum days to plot)
+    # Sanity checks (cycles to plot, minimum days to plot)
+    if len(cycles) < 1:
+        raise ValueError('No cycles were specified for display.')
     if days < 3:
         days = 3
 
     # Calculate the midpoint of the chart
     middays = math.floor(days / 2)
 
+    # Calculate the date values, day counts, and all selected point values
+    dates, counts, values = get_values(birthdate=birthdate,
+                                       plotdate=plotdate, days=days,
+                                       waves=[c.period for c in cycles])
+
+    # Create the data labels
+    plot = plotdate.item().strftime(longdate)
+    birth = birthdate.item().strftime(longdate)
+    count = number.format(counts[middays])
+
+    # Create a new figure measured in inches (100px per inch)
+    figure = plt.figure(figsize=(10, 4.5))
+    figure.canvas.manager.set_window_title('biorhythm')
+
+    # Draw the chart layout
+    title = 'Biorhythm for {plot}'.format(plot=plot)
+    info = 'Birth:  {birth} ({count} days)'.format(birth=birth, count=count)
+    axes, _ = draw_bio(figure=figure, dates=dates, middays=middays,
+                       title=title, info=info)
+
+    # Plot the data values, one matrix row per cycle
+    for row, cycle in zip(values, cycles):
+        axes.plot(dates, row, label=cycle.name.title(), linewidth=2,
+                  marker='_')
+
+    # Show the legend
+    axes.legend(bbox_to_anchor=(1.0, 1.0), loc='upper left', fontsize=10)
+
+    # Optimize the padding and show the chart
+    figure.tight_layout()
+    plt.show(block=block)
+
+
+def select_cycles(physical=False, emotional=False,
+                  intellectual=False, spiritual=False,
+                  intuition=False, awareness=False,
+                  aesthetic=False):
+    """ Selects the cycles to show from the shared cycle registry.
+    PARAMETERS:
+    physical     : show the physical cycle
+    emotional    : show the emotional cycle
+    intellectual : show the intellectual cycle
+    spiritual    : show the spiritual cycle
+    intuition    : show the intuition cycle
+    awareness    : show the awareness cycle
+    aesthetic    : show the aesthetic cycle
+    RETURNS:
+    The selected cycles in registry order; any other registered cycles are
+    included when they are enabled in the registry
+    """
+    show = {'physical': physical, 'emotional': emotional,
+            'intellectual': intellectual, 'spiritual': spiritual,
+            'intuition': intuition, 'awareness': awareness,
+            'aesthetic': aesthetic}
+    return [cycle for cycle in get_cycles()
+            if show.get(cycle.name, cycle.enabled)]
+
+
+def get_values(birthdate=None,
+               plotdate=None,
+               days=29, waves=None):
+    """ Gets the cycle values for a range of days around the plot date.
+    PARAMETERS:
+    birthdate : the NumPy birth date of the person
+    plotdate  : the NumPy plot date, in the middle of the range
+    days      : the number of days to calculate
+    waves     : the wavelengths (days per cycle) of the cycles, default is
+                the active set of the shared cycle registry
+    RETURNS:
+    The NumPy dates, the day counts since birth, and the point values as a
+    float64 matrix shaped (cycles, days), one row per wavelength
+    """
+    birthdate = np.datetime64(today()) if birthdate is None else birthdate
+    plotdate = np.datetime64(today()) if plotdate is None else plotdate
+
     # Calculate the sets of date values and day counts since birth
+    if waves is None:
+        waves = get_periods()
+    middays = math.floor(days / 2)
     lowdate = plotdate - np.timedelta64(middays, 'D')
-    dates = np.array([lowdate + np.timedelta64(x, 'D') for x in range(days)],
-                     dtype=np.datetime64)
+    dates = lowdate + np.arange(days, dtype='timedelta64[D]')
     counts = np.array(dates - birthdate, dtype=np.int64)
 
-    # Calculate the primary sets of point values
+    # Calculate the sets of point values for all of the cycles at once
     # https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)#Calculation
     # Sine oscillates between -1 and +1 as increasing radian values are
     # passed; the angle value is calculated using 2*PI, which is the
@@ -133,103 +261,303 @@ def get_bio(birthdate=np.datetime64('today'),
     # then multiply by the number of days since birth and divide by the
     # wavelength; the resulting amplitude will be a decimal value which
     # occurs somewhere between -1 and +1
-    cycles = 0
-    pvalues = None
-    if physical:
-        pvalues = np.sin((counts * 2 * np.pi) / pwave, dtype=np.float64)
-        cycles += 1
-    evalues = None
-    if emotional:
-        evalues = np.sin((counts * 2 * np.pi) / ewave, dtype=np.float64)
-        cycles += 1
-    ivalues = None
-    if intellectual:
-        ivalues = np.sin((counts * 2 * np.pi) / iwave, dtype=np.float64)
-        cycles += 1
-
-    # Calculate the secondary sets of point values
-    sp2values = None
-    if spiritual:
-        sp2values = np.sin((counts * 2 * np.pi) / sp2wave, dtype=np.float64)
-        cycles += 1
-    in2values = None
-    if intuition:
-        in2values = np.sin((counts * 2 * np.pi) / in2wave, dtype=np.float64)
-        cycles += 1
-    aw2values = None
-    if awareness:
-        aw2values = np.sin((counts * 2 * np.pi) / aw2wave, dtype=np.float64)
-        cycles += 1
-    ae2values = None
-    if aesthetic:
-        ae2values = np.sin((counts * 2 * np.pi) / ae2wave, dtype=np.float64)
-        cycles += 1
-
-    # Sanity check (cycles to plot)
-    if cycles < 1:
-        raise ValueError('No cycles were specified for display.')
+    # Broadcasting the row of angles against a column of wavelengths
+    # yields the (cycles, days) matrix in a single operation
+    waves = np.asarray(waves, dtype=np.int64).reshape(-1, 1)
+    values = np.sin((counts * 2 * np.pi) / waves, dtype=np.float64)
+    return dates, counts, values
 
-    # Create the data labels
-    plot = plotdate.item().strftime(longdate)
-    birth = birthdate.item().strftime(longdate)
-    count = number.format(counts[middays])
 
-    # Create a new figure measured in inches (100px per inch)
-    plt.figure(figsize=(10, 4.5))
-    plt.gcf().canvas.manager.set_window_title('biorhythm')
+def draw_bio(figure, dates, middays, title, info):
+    """ Draws the layout of a biorhythm chart, without any cycle values.
+    PARAMETERS:
+    figure  : the Matplotlib figure to draw on
+    dates   : the NumPy dates of the x-axis
+    middays : the index of the plot date within the dates
+    title   : the title of the chart
+    info    : the birth date information of the chart
+    RETURNS:
+    The axes of the chart and the text of the birth date information
+    """
+    import matplotlib.dates as mdates
+    import matplotlib.ticker as mticker
+
+    # Define the output date format
+    shortdate = '%a %b %d'  # Wed Jan 31
 
     # Set the title
-    plt.title('Biorhythm for {plot}'.format(plot=plot), fontsize=16)
+    axes = figure.gca()
+    axes.set_title(title, fontsize=16)
 
     # Include the birth date information
-    info = 'Birth:  {birth} ({count} days)'.format(birth=birth, count=count)
-    plt.gcf().text(0.1, 0.89, info, fontsize=8)
+    text = figure.text(0.1, 0.89, info, fontsize=8)
 
     # Set the x-axis labels
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter(shortdate))
-    plt.xlabel('Date', fontsize=10)
-    plt.xticks(dates, rotation=90, fontsize=8)
+    axes.xaxis.set_major_formatter(mdates.DateFormatter(shortdate))
+    axes.set_xlabel('Date', fontsize=10)
+    axes.set_xticks(dates)
+    axes.tick_params(axis='x', labelrotation=90, labelsize=8)
 
     # Set the y-axis labels
-    plt.gca().yaxis.set_major_formatter(mticker.PercentFormatter(1.0))
-    plt.ylabel('Passive  Critical  Active', fontsize=10)
-    plt.ylim([-1.1, 1.1])  # from -100% to +100% with 10% padding
+    axes.yaxis.set_major_formatter(mticker.PercentFormatter(1.0))
+    axes.set_ylabel('Passive  Critical  Active', fontsize=10)
+    axes.set_ylim([-1.1, 1.1])  # from -100% to +100% with 10% padding
 
     # Enable the grid lines
-    plt.grid(alpha=0.35)
+    axes.grid(alpha=0.35)
 
     # Highlight the current day (y = yellow)
-    plt.axvspan(dates[middays - 1], dates[middays + 1], color='y', alpha=0.15)
-
-    # Plot the primary data values
-    if pvalues is not None:
-        plt.plot(dates, pvalues, label='Physical', linewidth=2, marker='_')
-    if evalues is not None:
-        plt.plot(dates, evalues, label='Emotional', linewidth=2, marker='_')
-    if ivalues is not None:
-        plt.plot(dates, ivalues, label='Intellectual', linewidth=2, marker='_')
-
-    # Plot the secondary data values
-    if sp2values is not None:
-        plt.plot(dates, sp2values, label='Spiritual', linewidth=2, marker='_')
-    if in2values is not None:
-        plt.plot(dates, in2values, label='Intuition', linewidth=2, marker='_')
-    if aw2values is not None:
-        plt.plot(dates, aw2values, label='Awareness', linewidth=2, marker='_')
-    if ae2values is not None:
-        plt.plot(dates, ae2values, label='Aesthetic', linewidth=2, marker='_')
+    axes.axvspan(dates[middays - 1], dates[middays + 1], color='y', alpha=0.15)
+    return axes, text
 
-    # Show the legend
-    plt.legend(bbox_to_anchor=(1.0, 1.0), loc='upper left', fontsize=10)
 
-    # Optimize the padding and show the chart
-    plt.tight_layout()
-    plt.show(block=block)
+def get_images(birthdates, plotdate=None,
+               physical=True, emotional=True,
+               intellectual=True, spiritual=False,
+               intuition=False, awareness=False,
+               aesthetic=False, days=29,
+               fmt='png', filenames=None):
+    """ Gets biorhythm chart images without a display, one per person.
+    PARAMETERS:
+    birthdates   : the NumPy birth dates of the people
+    plotdate     : the NumPy plot date of the charts
+    physical     : show the physical cycle
+    emotional    : show the emotional cycle
+    intellectual : show the intellectual cycle
+    spiritual    : show the spiritual cycle
+    intuition    : show the intuition cycle
+    awareness    : show the awareness cycle
+    aesthetic    : show the aesthetic cycle
+    days         : the number of days to plot
+    fmt          : the image format, such as 'png' or 'svg'
+    filenames    : the image file names, one per birth date, or None
+    RETURNS:
+    The image data (bytes) for each birth date, or the file names when given
+    NOTES:
+    The charts are drawn with the non-interactive Agg canvas, so no display
+    is required.  One figure is created and reused for every birth date;
+    only the cycle values and the birth date information are updated.
+    """
+    plotdate = np.datetime64(today()) if plotdate is None else plotdate
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
+    # Define the output date and number formats
+    longdate = '%A, %B %d, %Y'  # Wednesday, January 31, 1900
+    number = '{:,}'             # 9,999
+
+    # Select the cycles from the shared cycle registry
+    # https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
+    cycles = select_cycles(physical=physical, emotional=emotional,
+                           intellectual=intellectual, spiritual=spiritual,
+                           intuition=intuition, awareness=awareness,
+                           aesthetic=aesthetic)
+
+    # Sanity checks (cycles to plot, minimum days to plot)
+    if len(cycles) < 1:
+        raise ValueError('No cycles were specified for display.')
+    if days < 3:
+        days = 3
 
-def main(year=datetime.now().year,
-         month=datetime.now().month,
-         day=datetime.now().day,
+    # Calculate the midpoint of the chart and the shared date values
+    middays = math.floor(days / 2)
+    waves = [cycle.period for cycle in cycles]
+    dates, _, _ = get_values(plotdate=plotdate, days=days, waves=waves)
+
+    # Create one figure measured in inches (100px per inch), drawn once
+    figure = Figure(figsize=(10, 4.5))
+    FigureCanvasAgg(figure)
+    title = 'Biorhythm for {plot}'.format(
+        plot=plotdate.item().strftime(longdate))
+    axes, text = draw_bio(figure=figure, dates=dates, middays=middays,
+                          title=title, info='')
+    lines = [axes.plot(dates, np.zeros(days), label=cycle.name.title(),
+                       linewidth=2, marker='_')[0]
+             for cycle in cycles]
+    axes.legend(bbox_to_anchor=(1.0, 1.0), loc='upper left', fontsize=10)
+    figure.tight_layout()
+
+    # Update the line values and birth date information for each person
+    images = []
+    births = np.atleast_1d(np.asarray(birthdates, dtype='datetime64[D]'))
+    for index, birthdate in enumerate(births):
+        _, counts, values = get_values(birthdate=birthdate,
+                                       plotdate=plotdate, days=days,
+                                       waves=waves)
+        for line, row in zip(lines, values):
+            line.set_ydata(row)
+        birth = birthdate.item().strftime(longdate)
+        count = number.format(counts[middays])
+        text.set_text('Birth:  {birth} ({count} days)'.format(birth=birth,
+                                                              count=count))
+        if filenames is None:
+            buffer = io.BytesIO()
+            figure.savefig(buffer, format=fmt)
+            images.append(buffer.getvalue())
+        else:
+            figure.savefig(filenames[index], format=fmt)
+            images.append(filenames[index])
+    return images
+
+
+def get_batch(birthdates, plotdates):
+    """ Gets the primary cycle values for many people and many dates at once.
+    PARAMETERS:
+    birthdates : the NumPy birth dates of the people
+    plotdates  : the NumPy plot dates of the values
+    RETURNS:
+    The physical, emotional, intellectual, and average values as float64
+    matrices shaped (people, days), one row per birth date
+    """
+
+    # Define the primary wavelengths (days per cycle) from the shared registry
+    # https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
+    pwave = get_period('physical')
+    ewave = get_period('emotional')
+    iwave = get_period('intellectual')
+
+    # Calculate the day counts since birth for every person and date pair
+    # Broadcasting a column of birth dates against a row of plot dates
+    # yields the (people, days) matrix without any Python level loops
+    births = np.atleast_1d(np.asarray(birthdates, dtype='datetime64[D]'))
+    plots = np.atleast_1d(np.asarray(plotdates, dtype='datetime64[D]'))
+    counts = np.array(plots[np.newaxis, :] - births[:, np.newaxis],
+                      dtype=np.int64)
+
+    # Calculate the point values, reducing the counts to the day within each
+    # cycle first so that very large counts keep their precision
+    pvalues = np.sin(((counts % pwave) * 2 * np.pi) / pwave, dtype=np.float64)
+    evalues = np.sin(((counts % ewave) * 2 * np.pi) / ewave, dtype=np.float64)
+    ivalues = np.sin(((counts % iwave) * 2 * np.pi) / iwave, dtype=np.float64)
+    avalues = (pvalues + evalues + ivalues) / 3
+    return pvalues, evalues, ivalues, avalues
+
+
+def get_compatibility(birthdates, waves=None):
+    """ Gets the compatibility of every pair of people, cycle by cycle.
+    PARAMETERS:
+    birthdates : the NumPy birth dates of the people
+    waves      : the wavelengths (days per cycle), default is the active set
+    RETURNS:
+    The first and second person of each pair (indices into the birth dates),
+    the phase offsets in days, and the compatibility from 0 (opposite) to 1
+    (identical), the last two as matrices shaped (pairs, cycles)
+    NOTES:
+    Two cycles of the same wavelength keep the same phase offset on every
+    day, so the compatibility does not depend on the plot dates at all.  The
+    offset only depends on the difference of the birth dates modulo each
+    wavelength, so all of the pairs share at most one wavelength of distinct
+    compatibility values per cycle, looked up from a table.
+    """
+
+    # Define the wavelengths (days per cycle) from the shared registry
+    # https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
+    if waves is None:
+        waves = get_periods()
+    periods = np.asarray(waves, dtype=np.int64)
+
+    # Calculate the birth date offsets of every pair of people (i < j)
+    births = np.atleast_1d(np.asarray(birthdates, dtype='datetime64[D]'))
+    first, second = np.triu_indices(births.size, k=1)
+    deltas = np.array(births[second] - births[first], dtype=np.int64)
+
+    # Reduce the offsets to the day within each cycle (0 to wavelength - 1)
+    offsets = deltas[:, np.newaxis] % periods[np.newaxis, :]
+
+    # Calculate the table of every possible compatibility, one wavelength of
+    # values per cycle laid end to end, (1 + cos(2 * PI * offset / wave)) / 2
+    starts = np.concatenate(([0], np.cumsum(periods)[:-1]))
+    days = np.arange(periods.sum()) - np.repeat(starts, periods)
+    table = (1 + np.cos((days * 2 * np.pi) / np.repeat(periods, periods))) / 2
+
+    # Look up the compatibility of every pair and cycle at once
+    compatibility = table[offsets + starts[np.newaxis, :]]
+    return (first, second), offsets, compatibility
+
+
+class Series:
+    """ A class for reading a precomputed biorhythm series file.
+    ATTRIBUTES:
+    birthdate : the NumPy birth date of the person
+    startdate : the NumPy date of the first value
+    waves     : the wavelengths (days per cycle), one per matrix row
+    values    : the memory-mapped float64 matrix shaped (cycles, days)
+    NOTES:
+    The file starts with a fixed-width header (magic, version, number of
+    cycles, birth date, start date, and number of days), followed by the
+    int32 wavelengths padded to 8 bytes, followed by the packed float64
+    values, one contiguous row per cycle.  Nothing is parsed or copied;
+    slices are NumPy views into the memory-mapped file.
+    """
+    magic = b'BIOR'  # identifies the file format
+    version = 1  # file format version
+    header = struct.Struct('<4sHHqqq')  # fixed-width, little-endian
+
+    def __init__(self, filename):
+        """ Opens a series file for reading.
+        PARAMETERS:
+        filename : the name of the series file
+        """
+        with open(filename, 'rb') as file:
+            magic, version, cycles, birth, start, days = \
+                Series.header.unpack(file.read(Series.header.size))
+            if magic != Series.magic or version != Series.version:
+                raise ValueError('Not a biorhythm series file: ' + filename)
+            waves = np.frombuffer(file.read(4 * cycles), dtype='<i4')
+        self.birthdate = np.datetime64(birth, 'D')
+        self.startdate = np.datetime64(start, 'D')
+        self.waves = tuple(int(wave) for wave in waves)
+        offset = Series.header.size + (4 * cycles + 7) // 8 * 8
+        self.values = np.memmap(filename, dtype='<f8', mode='r',
+                                offset=offset, shape=(cycles, days))
+
+    def get_slice(self, lowdate, highdate):
+        """ Gets the values for a date range, without copying.
+        PARAMETERS:
+        lowdate  : the NumPy first date of the range
+        highdate : the NumPy last date of the range
+        RETURNS:
+        The NumPy dates and a view of the values shaped (cycles, days)
+        """
+        low = int((np.datetime64(lowdate, 'D') - self.startdate).astype(int))
+        high = int((np.datetime64(highdate, 'D') - self.startdate).astype(int))
+        if low < 0 or high >= self.values.shape[1] or low > high:
+            raise ValueError('The date range is outside of the series.')
+        dates = self.startdate + np.arange(low, high + 1,
+                                           dtype='timedelta64[D]')
+        return dates, self.values[:, low:high + 1]
+
+
+def write_series(filename, birthdate, startdate, days, waves=None):
+    """ Writes a precomputed biorhythm series file, see the Series class.
+    PARAMETERS:
+    filename  : the name of the series file
+    birthdate : the NumPy birth date of the person
+    startdate : the NumPy date of the first value
+    days      : the number of days to calculate
+    waves     : the wavelengths (days per cycle) of the cycles, default is
+                the active set of the shared cycle registry
+    """
+    if waves is None:
+        waves = get_periods()
+    birthdate = np.datetime64(birthdate, 'D')
+    startdate = np.datetime64(startdate, 'D')
+    plotdate = startdate + np.timedelta64(math.floor(days / 2), 'D')
+    _, _, values = get_values(birthdate=birthdate, plotdate=plotdate,
+                              days=days, waves=waves)
+    waves = np.asarray(waves, dtype='<i4')
+    with open(filename, 'wb') as file:
+        file.write(Series.header.pack(Series.magic, Series.version,
+                                      len(waves),
+                                      int(birthdate.astype(np.int64)),
+                                      int(startdate.astype(np.int64)),
+                                      days))
+        file.write(waves.tobytes())
+        file.write(bytes(-(4 * len(waves)) % 8))  # align the values
+        values.astype('<f8').tofile(file)
+
+
+def main(year=None, month=None, day=None,
          physical=True, emotional=True,
          intellectual=True, spiritual=False,
          intuition=False, awareness=False,
@@ -248,6 +576,10 @@ def main(year=datetime.now().year,
     aesthetic    : show the aesthetic cycle
     block        : block the process while the chart window is open
     """
+    current = now()  # one reading of the clock for all of the parts
+    year = current.year if year is None else year
+    month = current.month if month is None else month
+    day = current.day if day is None else day
 
     # Combine the integers into a NumPy compatible date
     y = str(year).zfill(4)[:4]
@@ -0,0 +1,284 @@
+﻿#!/usr/bin/env python3
+""" A Python module for serving biorhythm charts over HTTP (Async Version).
+
+Serves the text charts, data rows, and JSON data of the Biorhythm class from
+an asyncio event loop, using only the standard library.  Each request is one
+GET with the birth date and plot date range in the query string; the charts
+are rendered in an executor, so the event loop only moves bytes, and the data
+rows and JSON data are streamed in chunks as they are rendered.
+
+GET /chart?birth=1809-02-12&plot=1863-07-02&days=14&width=45
+GET /datarows?birth=1809-02-12&plot=1863-07-02&days=14
+GET /json?birth=1809-02-12&plot=1863-07-02&days=14&indent=4&orient=rows
+
+The plot date defaults to today and the other parameters default to those of
+the Biorhythm methods.  Each path only accepts its own parameters, and the
+numbers are capped (see limits), so a single request cannot render without
+bound.  Errors are returned as a JSON object with a message.
+
+For more information on biorhythms:
+https://en.wikipedia.org/wiki/Biorhythm_(pseudoscience)
+
+MIT License
+
+Copyright (c) 2026 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+FOR ENTERTAINMENT PURPOSES ONLY.
+
+Create a custom script to start the service with a shared chart cache.
+
+#!/usr/bin/env python3
+from biorhythm_class import Biorhythm
+import biorhythm_server
+Biorhythm.cache = 1024  # repeated requests are served from the cache
+biorhythm_server.main(host='127.0.0.1', port=8080)
+
+Create a custom script to request a chart from the running service.
+
+#!/usr/bin/env python3
+from urllib.request import urlopen
+url = 'http://127.0.0.1:8080/chart?birth=1809-02-12&plot=1863-07-02'
+with urlopen(url) as response:
+    print(response.read().decode('utf-8'))
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+from datetime import datetime, timedelta
+from functools import partial
+from http import HTTPStatus
+from itertools import islice
+from urllib.parse import parse_qsl, urlsplit
+import asyncio
+import json
+
+from biorhythm_class import Biorhythm
+from biorhythm_cycles import now
+
+timeout = 30  # seconds to wait for a request line or header line
+headers = 100  # maximum number of header lines in a request
+batch = 64  # number of chunks to render in the executor at once
+limits = {'days': 3660, 'width': 1000, 'indent': 16}  # maximum values
+
+
+def get_params(query, names):
+    """ Gets the chart and method parameters from a query string.
+    PARAMETERS:
+    query : query string of the request URL
+    names : names of the parameters accepted by the path, besides the birth
+            and plot dates
+    RETURNS:
+    The chart for the birth date, and the keyword arguments of the method
+    NOTES:
+    Raises a ValueError for a missing birth date, an unknown parameter, or
+    an invalid parameter, including a number above its limit or a date range
+    outside of the supported dates.
+    """
+    params = dict(parse_qsl(query))
+    if 'birth' not in params:
+        raise ValueError('Missing parameter: birth')
+    kwargs = {'plot': now()}  # read from the clock per request
+    for name, value in params.items():
+        if name in {'birth', 'plot'}:
+            kwargs[name] = datetime.fromisoformat(value)
+        elif name not in names:
+            raise ValueError(f'Unknown parameter: {name}')
+        elif name in limits:
+            kwargs[name] = int(value)
+            if not 0 <= kwargs[name] <= limits[name]:
+                raise ValueError(f'Invalid parameter: {name}')
+        elif name == 'orient':
+            if value not in {'rows', 'lines', 'columns'}:
+                raise ValueError(f'Unknown JSON orient: {value}')
+            kwargs[name] = value
+    span = timedelta(days=kwargs.get('days', 0))  # requested range only
+    try:  # every date of the range must be a valid date
+        kwargs['plot'] - span, kwargs['plot'] + span
+    except OverflowError:
+        raise ValueError('Invalid parameter: plot') from None
+    return Biorhythm(birth=kwargs.pop('birth')), kwargs
+
+
+async def send(writer, status, content_type, body=None):
+    """ Sends the response head, and the complete body if any.
+    PARAMETERS:
+    writer       : stream writer of the connection
+    status       : HTTP status code of the response
+    content_type : media type of the response body
+    body         : complete response body (bytes), or None to send chunks
+    """
+    lines = [f'HTTP/1.1 {status} {HTTPStatus(status).phrase}',
+             f'Content-Type: {content_type}',
+             'Connection: close']
+    if body is None:  # the chunks follow, see the stream function
+        lines.append('Transfer-Encoding: chunked')
+    else:
+        lines.append(f'Content-Length: {len(body)}')
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+    if body is not None:
+        writer.write(body)
+    await writer.drain()
+
+
+async def send_error(writer, status, message):
+    """ Sends an error response as a JSON object.
+    PARAMETERS:
+    writer  : stream writer of the connection
+    status  : HTTP status code of the response
+    message : error message of the response
+    """
+    body = json.dumps({'error': message}).encode('utf-8')
+    await send(writer, status, 'application/json', body)
+
+
+async def stream(writer, executor, chunks, content_type):
+    """ Streams the chunks of a response as they are rendered.
+    PARAMETERS:
+    writer       : stream writer of the connection
+    executor     : executor for rendering the chunks
+    chunks       : iterator of the response body (strings)
+    content_type : media type of the response body
+    NOTES:
+    The chunks are rendered in batches in the executor.  The first batch is
+    rendered before the response head is sent, so that invalid parameters
+    still return an error status.  Waiting for each batch to drain stops
+    rendering for slow clients.
+    """
+    loop = asyncio.get_running_loop()
+
+    def render():  # inner function, renders the next batch of chunks
+        return ''.join(islice(chunks, batch)).encode('utf-8')
+    data = await loop.run_in_executor(executor, render)
+    await send(writer, 200, content_type)
+    while data:
+        writer.write(b'%x\r\n%s\r\n' % (len(data), data))
+        await writer.drain()
+        data = await loop.run_in_executor(executor, render)
+    writer.write(b'0\r\n\r\n')  # last chunk
+    await writer.drain()
+
+
+async def chart(writer, executor, bio, **kwargs):
+    """ Responds with a chart (text). """
+    loop = asyncio.get_running_loop()
+    text = await loop.run_in_executor(executor, partial(bio.render, **kwargs))
+    await send(writer, 200, 'text/plain; charset=utf-8', text.encode('utf-8'))
+
+
+async def datarows(writer, executor, bio, **kwargs):
+    """ Responds with the data rows, one JSON object per line (NDJSON). """
+    kwargs['orient'] = 'lines'
+    await stream(writer, executor, bio.iter_json(**kwargs),
+                 'application/x-ndjson')
+
+
+async def json_data(writer, executor, bio, **kwargs):
+    """ Responds with the JSON data in the requested layout. """
+    await stream(writer, executor, bio.iter_json(**kwargs),
+                 'application/json')
+
+
+routes = {'/chart': (chart, {'days', 'width'}),  # handler, parameters
+          '/datarows': (datarows, {'days'}),
+          '/json': (json_data, {'days', 'indent', 'orient'})}
+
+
+async def handle(reader, writer, executor=None):
+    """ Handles one request of a connection.
+    PARAMETERS:
+    reader   : stream reader of the connection
+    writer   : stream writer of the connection
+    executor : executor for rendering, default is the event loop's executor
+    """
+    try:
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            method, target, _ = line.decode('latin-1').split(' ', 2)
+            for _ in range(headers):  # headers are not used, only skipped
+                line = await asyncio.wait_for(reader.readline(), timeout)
+                if line in {b'\r\n', b'\n', b''}:
+                    break
+            else:
+                raise ValueError('Too many headers')
+        except (ValueError, asyncio.TimeoutError):
+            await send_error(writer, 400, 'Bad request')
+            return
+        url = urlsplit(target)
+        if url.path not in routes:
+            await send_error(writer, 404, f'Unknown path: {url.path}')
+            return
+        if method != 'GET':
+            await send_error(writer, 405, f'Unknown method: {method}')
+            return
+        route, names = routes[url.path]
+        try:
+            bio, kwargs = get_params(url.query, names)
+            await route(writer, executor, bio, **kwargs)
+        except (OverflowError, TypeError, ValueError) as error:  # invalid
+            await send_error(writer, 400, str(error) or 'Bad request')
+    except ConnectionError:  # client went away, nothing left to send
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve(host='127.0.0.1', port=8080, executor=None, backlog=1024):
+    """ Starts the service.
+    PARAMETERS:
+    host     : host name or address to listen on
+    port     : port number to listen on, 0 for any free port
+    executor : executor for rendering, default is the event loop's executor
+    backlog  : maximum number of queued connections
+    RETURNS:
+    The asyncio server, already listening
+    NOTES:
+    The data rows and JSON data are rendered by generators, so the executor
+    must be a thread pool (not a process pool).
+    """
+    return await asyncio.start_server(partial(handle, executor=executor),
+                                      host=host, port=port, backlog=backlog)
+
+
+def main(host='127.0.0.1', port=8080):
+    """ Defines the main entry point of the program.
+    PARAMETERS:
+    host : host name or address to listen on
+    port : port number to listen on
+    """
+    async def run():  # inner function, serves until interrupted
+        server = await serve(host=host, port=port)
+        async with server:
+            print('Serving on', *(sock.getsockname()[:2]
+                                  for sock in server.sockets))
+            await server.serve_forever()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':  # module can be imported or started directly
+    main()